@@ -1,19 +1,14 @@
-import streamlit as st
-import requests
 import os
-from typing import List, Dict
+import streamlit as st
 from streamlit_option_menu import option_menu
 
-# Import module functions
-from certifications import render_certifications_section, sample_certifications
-from contacts import render_contact_section, sample_resumes
-from skills import render_skills_section, sample_skills
-from image_utils import get_image_base64
-from education import education_section
-from profiles import profile_section
-from projects import render_projects_section, sample_projects
-from experience import render_experience_section
-from experience_data import sample_experiences
+# Section modules (and the heavy libraries they use) are imported on first use
+from lazy_loader import load_component, load_data
+from global_search import render_global_search
+import page_assets
+from asset_cache import render_asset_cache
+import payload_debug
+from style_registry import inject_styles
 
 # Page configuration
 st.set_page_config(
@@ -31,11 +26,16 @@ if 'selected' not in st.session_state:
     st.session_state.selected = "Profile"
 
 
-
-# Base CSS for the entire application
-def load_base_css():
-    with open("styles.css") as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+# Section name -> (module, render function, (data module, data name) or None)
+SECTIONS = {
+    "Profile": ("profiles", "profile_section", None),
+    "Education": ("education", "education_section", None),
+    "Skills": ("skills", "render_skills_section", ("skills", "sample_skills")),
+    "Projects": ("projects", "render_projects_section", ("projects", "sample_projects")),
+    "Certifications": ("certifications", "render_certifications_section", ("certifications", "sample_certifications")),
+    "Experience": ("experience", "render_experience_section", ("experience_data", "sample_experiences")),
+    "Contact": ("contacts", "render_contact_section", ("contacts", "sample_resumes")),
+}
 
 # Define callback for navbar selection
 def on_navbar_change():
@@ -43,17 +43,12 @@ def on_navbar_change():
 
 # Main application function
 def main():
-    # Load base CSS first
-    load_base_css()
-
-    # Force background color to eliminate white corners and ensure theme consistency
-    st.markdown(r'''
-    <style>
-        body, [data-testid="stAppViewContainer"], [data-testid="stHeader"] {
-            background-color: #000033 !important;
-        }
-    </style>
-    ''', unsafe_allow_html=True)
+    # Record payload sizes for this rerun when opened with ?debug=payload
+    payload_debug.start()
+    # Inline images are sent once per run; repeats refer back to the first copy
+    page_assets.start()
+    # Browser-side image cache (only mounted when images are inlined)
+    render_asset_cache()
 
     # Global Particle Animation Container
     st.markdown("""
@@ -70,6 +65,9 @@ def main():
     </div>
     """, unsafe_allow_html=True)
 
+    # Search across every section; hits jump to the section that owns them
+    render_global_search()
+
     # Simple and reliable navigation
     selected = option_menu(
         menu_title=None,
@@ -113,21 +111,14 @@ def main():
     # Update session state with current selection
     st.session_state.selected = selected
 
+    # Add the shared stylesheet, which already holds every section's CSS
+    # (sent once per session, and again only when it changes)
+    module_name, component_name, data_source = SECTIONS[selected]
+    render_section = load_component(module_name, component_name)
+    inject_styles()
+
     # Social Media Links with Hover Effects
     st.markdown('''
-    <style>
-    .social-links a {
-        margin-right: 10px;
-        font-size: 20px;
-        color: var(--royal-accent); /* Use royal accent color */
-        text-decoration: none;
-        transition: transform 0.3s ease, color 0.3s ease;
-    }
-    .social-links a:hover {
-        transform: scale(1.2);
-        color: var(--royal-light-text); /* Lighter color on hover */
-    }
-    </style>
     <div class=\'social-links\'>
         <a href="https://www.linkedin.com/in/shahidnazeersyed/" target="_blank" title="LinkedIn"><i class="fab fa-linkedin"></i></a>
         <a href="https://github.com/Syedshahidnazeer" target="_blank" title="GitHub"><i class="fab fa-github"></i></a>
@@ -139,22 +130,18 @@ def main():
         st.markdown('<div class="main-content fade-in">', unsafe_allow_html=True)
         
         # Display the selected section content
-        if st.session_state.selected == "Profile":
-            profile_section()
-        elif st.session_state.selected == "Education":
-            education_section()
-        elif st.session_state.selected == "Skills":
-            render_skills_section(sample_skills, get_image_base64)
-        elif st.session_state.selected == "Projects":
-            render_projects_section(sample_projects)
-        elif st.session_state.selected == "Certifications":
-            render_certifications_section(sample_certifications)
-        elif st.session_state.selected == "Experience":
-            render_experience_section(sample_experiences)
-        elif st.session_state.selected == "Contact":
-            render_contact_section(sample_resumes)
+        with payload_debug.track(selected):
+            if data_source is None:
+                render_section()
+            else:
+                data = load_data(*data_source)
+                # load_data has already shown the error if the catalog failed to load
+                if data is not None:
+                    render_section(data)
         
         st.markdown('</div>', unsafe_allow_html=True)
 
+    payload_debug.render_panel()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,82 @@
+# asset_cache.py
+"""
+Browser-side cache of inline images, kept in IndexedDB.
+
+Without static serving, logos, gallery images and PDF previews are inlined as
+base64 data URIs, so every rerun sends them again. For example, switching to
+another section and back re-sends every logo on Education, Experience and
+Skills. With static serving they are fingerprinted URLs that the browser's
+HTTP cache already keeps, so the component is not mounted at all.
+
+The ``asset_cache`` component (a plain HTML frontend in
+``components/asset_cache``) is mounted once per page, with no height:
+
+    - it stores each inline image shown on the page in IndexedDB, keyed by
+      the content hash that ``page_assets`` puts in its ``data-asset`` attribute
+    - when it loads, it reports the hashes it holds. From then on, images the
+      browser holds, or was already sent this session, go out as placeholders
+      that the component fills in from IndexedDB
+    - if a placeholder's image is missing (e.g. site data was cleared), it
+      reports the hash and the next run inlines the image again
+
+Until the component has reported (the first run of a session, or a browser
+without IndexedDB), every image is inlined as before. The report reruns the
+page once per session.
+"""
+import logging
+import os
+import re
+from typing import Optional, Set
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from assets import static_serving_enabled
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FRONTEND_DIR = os.path.join(BASE_DIR, "components", "asset_cache")
+
+COMPONENT_KEY = "asset_cache"
+HELD_KEY = "asset_cache_held"
+REPORT_KEY = "asset_cache_report"
+# Upper bound on the hashes accepted from one report
+MAX_REPORTED = 2000
+
+_HASH_RE = re.compile(r"^[0-9a-f]{16}$")
+
+_asset_cache = components.declare_component("asset_cache", path=FRONTEND_DIR)
+
+
+def _hashes(values) -> Set[str]:
+    if not isinstance(values, list):
+        return set()
+    return {value for value in values[:MAX_REPORTED] if isinstance(value, str) and _HASH_RE.match(value)}
+
+
+def render_asset_cache() -> None:
+    """Mount the component (fallback mode only) and record which images the browser holds."""
+    if static_serving_enabled():
+        return
+    report = _asset_cache(key=COMPONENT_KEY, default=None)
+    if not isinstance(report, dict) or report.get("id") == st.session_state.get(REPORT_KEY):
+        return
+
+    st.session_state[REPORT_KEY] = report.get("id")
+    held = st.session_state.get(HELD_KEY) or set()
+    missing = _hashes(report.get("missing"))
+    st.session_state[HELD_KEY] = (held | _hashes(report.get("held"))) - missing
+    if missing:
+        logger.info(f"Browser asset cache is missing {len(missing)} image(s); inlining them again")
+
+
+def held_assets() -> Optional[Set[str]]:
+    """Return the hashes of the images the browser holds, or None until the component has reported."""
+    try:
+        return st.session_state.get(HELD_KEY)
+    except Exception:
+        # Outside a script run
+        return None
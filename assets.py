@@ -0,0 +1,350 @@
+# assets.py
+"""
+Runtime side of the asset pipeline.
+
+``build_assets.py`` writes content-hashed originals and resized variants into
+``static/assets/`` together with a manifest. The helpers here look a source
+path up in that manifest and pick the smallest variant that still covers the
+width it is drawn at. When the manifest is missing or a source file changed
+after the last build, they fall back to the original file.
+
+With ``server.enableStaticServing`` on (see ``.streamlit/config.toml``) assets
+are referenced by URL under ``app/static/assets/``. File names carry the
+content hash, so browsers can keep them cached across reruns and visits. When
+static serving is off, the helpers fall back to inline data URIs.
+"""
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import shutil
+import threading
+from typing import Dict, Optional, Tuple
+
+from encoder_cache import encode_file
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+ASSET_DIR = os.path.join(STATIC_DIR, "assets")
+MANIFEST_PATH = os.path.join(ASSET_DIR, "manifest.json")
+MANIFEST_VERSION = 1
+
+# URL prefix Streamlit serves the ``static/`` directory under
+STATIC_URL_PREFIX = "app/static/"
+
+# First-page PDF thumbnails live next to the other built assets
+THUMBNAIL_DIR = os.path.join(ASSET_DIR, "thumbs")
+THUMBNAIL_DPI = 72
+# Oversized pages (e.g. scans stored at poster size) are scaled down to this width
+THUMBNAIL_MAX_WIDTH = 800
+
+# Variants are picked for high-density screens: a 100 px logo uses a 200 px file
+DEFAULT_DENSITY = 2
+
+HASH_LENGTH = 16
+
+_manifest_lock = threading.Lock()
+_manifest_cache = {"mtime": None, "data": {}}
+
+# (path, size, mtime) -> content hash, for files whose stat no longer matches the manifest
+_rehash_cache: Dict[Tuple[str, int, float], str] = {}
+
+# (path, size, mtime) -> published file name under ASSET_DIR
+_publish_lock = threading.Lock()
+_published: Dict[Tuple[str, int, float], str] = {}
+
+# (content hash, dpi) -> lock, so each thumbnail is rasterized by one thread only
+_thumbnail_locks: Dict[Tuple[str, int], threading.Lock] = {}
+
+
+def hash_file(path: str, chunk_size: int = 1 << 20) -> str:
+    """Return the truncated SHA-256 content hash used to name built assets."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def relative_asset_path(path: str) -> str:
+    """Normalise a path to the project-relative, forward-slash form used as manifest key."""
+    return os.path.relpath(os.path.abspath(path), BASE_DIR).replace(os.sep, "/")
+
+
+def guess_mime(path: str) -> str:
+    """Guess a MIME type from a file name, defaulting to a binary stream."""
+    mime, _ = mimetypes.guess_type(path)
+    if mime is None and path.lower().endswith(".webp"):
+        mime = "image/webp"
+    if mime is None and path.lower().endswith(".avif"):
+        mime = "image/avif"
+    return mime or "application/octet-stream"
+
+
+def content_hash(path: str) -> str:
+    """Return a file's content hash, hashing it at most once per (path, size, mtime)."""
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime)
+    if key not in _rehash_cache:
+        _rehash_cache[key] = hash_file(path)
+    return _rehash_cache[key]
+
+
+def get_manifest() -> Dict:
+    """Load the asset manifest, re-reading it only when the file changes."""
+    try:
+        mtime = os.stat(MANIFEST_PATH).st_mtime
+    except OSError:
+        return {}
+
+    with _manifest_lock:
+        if _manifest_cache["mtime"] != mtime:
+            try:
+                with open(MANIFEST_PATH, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") != MANIFEST_VERSION:
+                    logger.warning(f"Ignoring asset manifest with version {data.get('version')}")
+                    data = {}
+            except (OSError, ValueError) as e:
+                logger.error(f"Error reading asset manifest: {e}")
+                data = {}
+            _manifest_cache["mtime"] = mtime
+            _manifest_cache["data"] = data
+        return _manifest_cache["data"]
+
+
+def get_asset_record(path: str) -> Optional[Dict]:
+    """Return the manifest record for a source file, or None if it is missing or stale."""
+    manifest = get_manifest()
+    source = manifest.get("sources", {}).get(relative_asset_path(path))
+    if source is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if stat.st_size != source["size"] or stat.st_mtime != source["mtime"]:
+        # A fresh checkout resets mtimes, so confirm by content before giving up
+        if content_hash(path) != source["hash"]:
+            # Source changed since the last build; the variants no longer match it
+            return None
+    record = manifest["assets"].get(source["hash"])
+    if record is not None:
+        record = dict(record, hash=source["hash"])
+    return record
+
+
+def get_variant_path(path: str, width: Optional[int] = None, fmt: str = "webp",
+                     density: int = DEFAULT_DENSITY) -> Tuple[str, str]:
+    """
+    Pick the file that should be shipped for an image drawn ``width`` CSS pixels wide.
+
+    Args:
+        path: Path of the source image (as used by the section modules)
+        width: Display width in CSS pixels, or None for the largest variant
+        fmt: Preferred variant format
+        density: Device pixel ratio to provision for
+
+    Returns:
+        (file path, MIME type) of the chosen variant, or of the original file
+    """
+    record = get_asset_record(path)
+    if not record or not record.get("variants"):
+        return path, guess_mime(path)
+
+    candidates = [v for v in record["variants"] if v["format"] == fmt]
+    if not candidates:
+        # e.g. "jpeg" requested for an image with transparency (built as PNG)
+        candidates = record["variants"]
+    candidates = sorted(candidates, key=lambda v: v["width"])
+
+    chosen = candidates[-1]
+    if width is not None:
+        needed = width * density
+        for variant in candidates:
+            if variant["width"] >= needed:
+                chosen = variant
+                break
+
+    variant_path = os.path.join(ASSET_DIR, chosen["file"])
+    if not os.path.exists(variant_path):
+        return path, guess_mime(path)
+    return variant_path, guess_mime(variant_path)
+
+
+def get_animation_paths(path: str) -> Optional[Dict[str, str]]:
+    """
+    Return the transcoded versions of an animated image written by ``build_assets.py``.
+
+    Returns:
+        File paths keyed by "poster", "webp", "mp4" and "webm" (whichever exist;
+        "webp" only when it is smaller than the original), or None if the image
+        is not animated or has not been built
+    """
+    record = get_asset_record(path)
+    animation = record.get("animation") if record else None
+    if not animation:
+        return None
+
+    paths = {}
+    for key in ("poster", "webp", "mp4", "webm"):
+        name = animation.get(key)
+        if name and os.path.exists(os.path.join(ASSET_DIR, name)):
+            paths[key] = os.path.join(ASSET_DIR, name)
+    if "webp" in paths and animation.get("webp_bytes", 0) >= record["bytes"]:
+        del paths["webp"]
+    return paths or None
+
+
+def static_serving_enabled() -> bool:
+    """Return True when Streamlit serves the ``static/`` directory."""
+    try:
+        import streamlit as st
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
+def asset_version() -> Tuple[bool, Optional[float]]:
+    """Return what asset URLs depend on: static serving and the manifest's mtime."""
+    try:
+        manifest_mtime = os.stat(MANIFEST_PATH).st_mtime
+    except OSError:
+        manifest_mtime = None
+    return static_serving_enabled(), manifest_mtime
+
+
+def publish_file(path: str) -> str:
+    """
+    Make sure a content-hashed copy of ``path`` exists under ``static/assets/``.
+
+    Files already written by ``build_assets.py`` are reused. Anything else is
+    hashed and copied on first use, once per (path, size, mtime).
+
+    Returns:
+        The published file name, relative to ``static/assets/``
+
+    Raises:
+        OSError: If the source file cannot be read
+    """
+    if os.path.abspath(path).startswith(ASSET_DIR + os.sep):
+        return os.path.relpath(os.path.abspath(path), ASSET_DIR).replace(os.sep, "/")
+
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime)
+    with _publish_lock:
+        if key in _published:
+            return _published[key]
+
+    record = get_asset_record(path)
+    if record is not None and os.path.exists(os.path.join(ASSET_DIR, record["original"])):
+        filename = record["original"]
+    else:
+        filename = f"{content_hash(path)}{os.path.splitext(path)[1].lower()}"
+        target = os.path.join(ASSET_DIR, filename)
+        if not os.path.exists(target):
+            os.makedirs(ASSET_DIR, exist_ok=True)
+            tmp_path = f"{target}.{threading.get_ident()}.tmp"
+            shutil.copyfile(path, tmp_path)
+            os.replace(tmp_path, target)
+            logger.info(f"Published {path} as {filename}")
+
+    with _publish_lock:
+        _published[key] = filename
+    return filename
+
+
+def asset_url(path: str, width: Optional[int] = None, fmt: str = "webp") -> str:
+    """
+    Return the fingerprinted static URL for a local file.
+
+    Args:
+        path: Path of the source file
+        width: For images, the display width used to pick a resized variant
+        fmt: Preferred variant format for images
+
+    Returns:
+        A relative URL such as ``app/static/assets/0a18473f2560174d-200w.webp``
+    """
+    if width is not None:
+        path, _ = get_variant_path(path, width, fmt)
+    return f"{STATIC_URL_PREFIX}assets/{publish_file(path)}"
+
+
+def data_uri(path: str) -> str:
+    """Return the contents of a local file as a base64 data URI (via the shared encoder cache)."""
+    return f"data:{guess_mime(path)};base64,{encode_file(path)}"
+
+
+def file_href(path: str) -> str:
+    """
+    Return a link target for a local file: a static URL when static serving is
+    on, otherwise an inline data URI.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    if static_serving_enabled():
+        return asset_url(path)
+    return data_uri(path)
+
+
+def image_src(path: str, width: Optional[int] = None, density: int = DEFAULT_DENSITY) -> str:
+    """Return an ``<img src>`` value for a local image drawn ``width`` CSS pixels wide."""
+    variant_path, _ = get_variant_path(path, width, density=density)
+    try:
+        return file_href(variant_path)
+    except OSError as e:
+        logger.error(f"Error loading image {path}: {e}")
+        return ""
+
+
+def get_pdf_thumbnail_path(pdf_path: str, dpi: int = THUMBNAIL_DPI) -> Optional[str]:
+    """
+    Return the path of a WebP thumbnail of a PDF's first page.
+
+    Thumbnails are rendered with PyMuPDF once per (file hash, DPI) and kept
+    under ``static/assets/thumbs/``, so every session and restart reuses them.
+
+    Returns:
+        The thumbnail path, or None if the PDF cannot be rasterized
+    """
+    try:
+        digest = content_hash(pdf_path)
+    except OSError as e:
+        logger.error(f"Error reading PDF {pdf_path}: {e}")
+        return None
+
+    thumb_path = os.path.join(THUMBNAIL_DIR, f"{digest}-{dpi}dpi.webp")
+    if os.path.exists(thumb_path):
+        return thumb_path
+
+    with _publish_lock:
+        lock = _thumbnail_locks.setdefault((digest, dpi), threading.Lock())
+    with lock:
+        if os.path.exists(thumb_path):
+            return thumb_path
+        try:
+            import fitz  # PyMuPDF
+            from PIL import Image
+
+            with fitz.open(pdf_path) as doc:
+                page = doc.load_page(0)
+                render_dpi = min(dpi, THUMBNAIL_MAX_WIDTH * 72 / page.rect.width)
+                pix = page.get_pixmap(dpi=max(1, round(render_dpi)))
+                img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
+            os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+            tmp_path = f"{thumb_path}.{threading.get_ident()}.tmp"
+            img.save(tmp_path, "WEBP", quality=80, method=6)
+            os.replace(tmp_path, thumb_path)
+            logger.info(f"Rendered thumbnail for {pdf_path}")
+            return thumb_path
+        except Exception as e:
+            logger.error(f"Error rendering thumbnail for {pdf_path}: {e}")
+            return None
@@ -0,0 +1,199 @@
+# benchmarks/cold_start.py
+"""
+Cold-start benchmark: interpreter import time per module and time-to-first-render
+per section, each measured in a fresh interpreter.
+
+Usage:
+    python benchmarks/cold_start.py                      # measure and print
+    python benchmarks/cold_start.py --write-baseline     # also write the JSON baseline
+    python benchmarks/cold_start.py --check              # exit 1 if a budget is exceeded
+
+Budgets (milliseconds) live in ``benchmarks/cold_start_budgets.json``. Run this
+whenever a dependency is added to ``requirements.txt``. The baseline records a
+hash of that file, so numbers from different dependency sets are not compared
+by accident.
+"""
+import argparse
+import functools
+import hashlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.join(REPO_DIR, "benchmarks")
+BUDGETS_PATH = os.path.join(BENCH_DIR, "cold_start_budgets.json")
+BASELINE_PATH = os.path.join(BENCH_DIR, "cold_start_baseline.json")
+
+MODULES = ("app", "skills", "education", "certifications", "contacts", "profiles", "projects", "experience")
+SECTIONS = ("Profile", "Education", "Skills", "Projects", "Certifications", "Experience", "Contact")
+
+# Runs in a fresh interpreter: drive app.py to the section and time the first script run
+RENDER_SCRIPT = """
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=300)
+at.session_state["selected"] = sys.argv[2]
+at.run()
+t2 = time.perf_counter()
+print(json.dumps({
+    "harness_ms": (t1 - t0) * 1000,
+    "first_render_ms": (t2 - t1) * 1000,
+    "exceptions": [str(e.value) for e in at.exception],
+}))
+"""
+
+
+def parse_importtime(stderr: str):
+    """Parse ``-X importtime`` output into [(cumulative_us, self_us, depth, module)]."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        except ValueError:
+            continue
+        # Nesting is shown as two extra spaces of indentation per level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((int(cumulative_us), int(self_us), depth, name.strip()))
+    return rows
+
+
+@functools.lru_cache(maxsize=None)
+def startup_modules() -> frozenset:
+    """Modules an empty interpreter imports on its own (``site``, ``encodings``, .pth hooks...)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass"],
+        cwd=REPO_DIR, capture_output=True, text=True,
+    )
+    return frozenset(name for _, _, _, name in parse_importtime(result.stderr))
+
+
+def measure_import(module: str, top: int = 10):
+    """Import ``module`` in a fresh interpreter and return its import-time breakdown."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    rows = parse_importtime(result.stderr)
+    total_us = next((cumulative for cumulative, _, depth, name in rows if depth == 0 and name == module), 0)
+    # Direct dependencies of the module, leaving out what interpreter startup imports anyway
+    startup = startup_modules()
+    children = sorted(
+        ((cumulative, name) for cumulative, _, depth, name in rows
+         if (depth == 1 or (depth == 0 and name != module)) and name not in startup),
+        reverse=True,
+    )
+    return {
+        "import_ms": total_us / 1000,
+        "heaviest": [{"module": name, "cumulative_ms": cumulative / 1000} for cumulative, name in children[:top]],
+    }
+
+
+def measure_first_render(section: str):
+    """Render ``section`` once in a fresh interpreter via Streamlit's AppTest."""
+    result = subprocess.run(
+        [sys.executable, "-c", RENDER_SCRIPT, os.path.join(REPO_DIR, "app.py"), section],
+        cwd=REPO_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"rendering {section} failed:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def median_of(samples, key):
+    return statistics.median(sample[key] for sample in samples)
+
+
+def requirements_hash() -> str:
+    try:
+        with open(os.path.join(REPO_DIR, "requirements.txt"), "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()[:16]
+    except OSError:
+        return ""
+
+
+def run(repeat: int):
+    report = {
+        "generated": int(time.time()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "requirements_sha": requirements_hash(),
+        "repeat": repeat,
+        "modules": {},
+        "sections": {},
+    }
+    for module in MODULES:
+        samples = [measure_import(module) for _ in range(repeat)]
+        report["modules"][module] = {
+            "import_ms": round(median_of(samples, "import_ms"), 1),
+            "heaviest": samples[-1]["heaviest"],
+        }
+        print(f"import {module:16s} {report['modules'][module]['import_ms']:8.1f} ms")
+
+    for section in SECTIONS:
+        samples = [measure_first_render(section) for _ in range(repeat)]
+        report["sections"][section] = {
+            "first_render_ms": round(median_of(samples, "first_render_ms"), 1),
+            "harness_ms": round(median_of(samples, "harness_ms"), 1),
+            "exceptions": samples[-1]["exceptions"],
+        }
+        print(f"render {section:16s} {report['sections'][section]['first_render_ms']:8.1f} ms")
+    return report
+
+
+def check_budgets(report, budgets):
+    """Return a list of human-readable budget violations."""
+    failures = []
+    for module, budget in budgets.get("modules", {}).items():
+        measured = report["modules"].get(module, {}).get("import_ms")
+        if measured is not None and measured > budget:
+            failures.append(f"import {module}: {measured:.1f} ms > budget {budget} ms")
+    for section, budget in budgets.get("sections", {}).items():
+        entry = report["sections"].get(section, {})
+        if entry.get("exceptions"):
+            failures.append(f"render {section}: raised {entry['exceptions'][0]}")
+        measured = entry.get("first_render_ms")
+        if measured is not None and measured > budget:
+            failures.append(f"render {section}: {measured:.1f} ms > budget {budget} ms")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start import and first-render times.")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh-interpreter runs per measurement (median is kept)")
+    parser.add_argument("--budgets", default=BUDGETS_PATH, help="JSON file with per-module/section budgets in ms")
+    parser.add_argument("--write-baseline", nargs="?", const=BASELINE_PATH, metavar="PATH",
+                        help=f"Write the report as a JSON baseline (default: {os.path.relpath(BASELINE_PATH, REPO_DIR)})")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 when a budget is exceeded")
+    args = parser.parse_args()
+
+    report = run(args.repeat)
+
+    with open(args.budgets, encoding="utf-8") as f:
+        budgets = json.load(f)
+    report["budgets"] = budgets
+    failures = check_budgets(report, budgets)
+
+    if args.write_baseline:
+        with open(args.write_baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.write_baseline}")
+
+    for failure in failures:
+        print(f"OVER BUDGET: {failure}")
+    if args.check and failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
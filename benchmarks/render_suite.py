@@ -0,0 +1,212 @@
+# benchmarks/render_suite.py
+"""
+Headless render benchmark: drives ``app.py`` with Streamlit's AppTest through
+every navigation entry and the skills/projects search and filter widgets.
+
+Every case runs in a fresh interpreter and records:
+    - wall time of the first script run and of the interaction reruns
+    - peak RSS of that interpreter
+    - total bytes of the element protos left on the page
+
+Usage:
+    python benchmarks/render_suite.py                    # run and compare with the baseline
+    python benchmarks/render_suite.py --check            # exit 1 on a regression
+    python benchmarks/render_suite.py --update-baseline  # overwrite the committed baseline
+    python benchmarks/render_suite.py --case skills      # only cases whose name contains "skills"
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from cold_start import REPO_DIR, BENCH_DIR, median_of, requirements_hash
+
+BASELINE_PATH = os.path.join(BENCH_DIR, "render_baseline.json")
+
+# Allowed growth over the baseline before a metric counts as a regression.
+# Times are noisy, so they also get an absolute slack; element bytes are deterministic.
+TOLERANCES = {
+    "wall_ms": {"ratio": 0.30, "slack": 150},
+    "peak_rss_mb": {"ratio": 0.15, "slack": 10},
+    "element_bytes": {"ratio": 0.05, "slack": 512},
+}
+
+# Each action is (widget type, widget label, method, value); a value of None
+# picks the widget's first option, and the action is skipped if it has none
+CASES = [
+    {"name": "profile", "section": "Profile", "actions": []},
+    {"name": "education", "section": "Education", "actions": []},
+    {"name": "skills", "section": "Skills", "actions": []},
+    {"name": "skills-search", "section": "Skills", "actions": [
+        ("text_input", "🔍 Search skills", "input", "data"),
+    ]},
+    {"name": "skills-filter", "section": "Skills", "actions": [
+        ("multiselect", "Filter by Skill", "select", "Python"),
+        ("multiselect", "Filter by Skill", "select", "MySQL"),
+    ]},
+    {"name": "skills-sort-recent", "section": "Skills", "actions": [
+        ("selectbox", "Sort by", "select", "Most Recent"),
+    ]},
+    {"name": "skills-detailed", "section": "Skills", "actions": [
+        ("radio", "View Mode", "set_value", "Detailed View"),
+    ]},
+    {"name": "projects", "section": "Projects", "actions": []},
+    {"name": "projects-search", "section": "Projects", "actions": [
+        ("text_input", "🔍 Search projects", "input", "analysis"),
+    ]},
+    {"name": "certifications", "section": "Certifications", "actions": []},
+    {"name": "experience", "section": "Experience", "actions": []},
+    {"name": "contact", "section": "Contact", "actions": []},
+]
+
+# Runs in a fresh interpreter so peak RSS belongs to a single case
+CASE_SCRIPT = """
+import json, resource, sys, time
+from streamlit.testing.v1 import AppTest
+
+case = json.loads(sys.argv[2])
+
+def element_bytes(node):
+    total = 0
+    proto = getattr(node, "proto", None)
+    if proto is not None and hasattr(proto, "ByteSize"):
+        total += proto.ByteSize()
+    children = getattr(node, "children", None)
+    if isinstance(children, dict):
+        total += sum(element_bytes(child) for child in children.values())
+    return total
+
+def find_widget(at, widget_type, label):
+    for widget in getattr(at, widget_type):
+        if widget.label == label:
+            return widget
+    raise LookupError(f"No {widget_type} labelled {label!r} on the page")
+
+at = AppTest.from_file(sys.argv[1], default_timeout=300)
+at.session_state["selected"] = case["section"]
+t0 = time.perf_counter()
+at.run()
+first_run_ms = (time.perf_counter() - t0) * 1000
+
+errors, notes = [], []
+t1 = time.perf_counter()
+for widget_type, label, method, value in case["actions"]:
+    if at.exception:
+        break
+    try:
+        widget = find_widget(at, widget_type, label)
+        if value is None:
+            if not widget.options:
+                notes.append(f"{label!r} has no options; action skipped")
+                continue
+            value = widget.options[0]
+        getattr(widget, method)(value).run()
+    except LookupError as e:
+        errors.append(str(e))
+        break
+interaction_ms = (time.perf_counter() - t1) * 1000
+
+print(json.dumps({
+    "first_run_ms": first_run_ms,
+    "interaction_ms": interaction_ms,
+    "wall_ms": first_run_ms + interaction_ms,
+    # ru_maxrss is reported in kilobytes on Linux
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "element_bytes": element_bytes(at._tree),
+    "exceptions": errors + [str(e.value) for e in at.exception],
+    "notes": notes,
+}))
+"""
+
+
+def run_case(case):
+    """Run one benchmark case in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", CASE_SCRIPT, os.path.join(REPO_DIR, "app.py"), json.dumps(case)],
+        cwd=REPO_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"case {case['name']} failed:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run(cases, repeat: int):
+    report = {
+        "generated": int(time.time()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "requirements_sha": requirements_hash(),
+        "repeat": repeat,
+        "cases": {},
+    }
+    for case in cases:
+        samples = [run_case(case) for _ in range(repeat)]
+        entry = {
+            key: round(median_of(samples, key), 1)
+            for key in ("first_run_ms", "interaction_ms", "wall_ms", "peak_rss_mb")
+        }
+        entry["element_bytes"] = samples[-1]["element_bytes"]
+        entry["exceptions"] = samples[-1]["exceptions"]
+        entry["notes"] = samples[-1]["notes"]
+        report["cases"][case["name"]] = entry
+        print(f"{case['name']:20s} {entry['wall_ms']:8.1f} ms {entry['peak_rss_mb']:7.1f} MB "
+              f"{entry['element_bytes']:>10,} B" + ("  (raised)" if entry["exceptions"] else ""))
+    return report
+
+
+def compare(report, baseline):
+    """Return a list of human-readable regressions against ``baseline``."""
+    regressions = []
+    for name, entry in report["cases"].items():
+        base = baseline.get("cases", {}).get(name)
+        if base is None:
+            continue
+        if entry["exceptions"] and not base.get("exceptions"):
+            regressions.append(f"{name}: now raises {entry['exceptions'][0]}")
+        for metric, tolerance in TOLERANCES.items():
+            limit = base[metric] * (1 + tolerance["ratio"]) + tolerance["slack"]
+            if entry[metric] > limit:
+                regressions.append(f"{name}: {metric} {entry[metric]:,} > {base[metric]:,} baseline")
+    if baseline.get("requirements_sha") not in (None, report["requirements_sha"]):
+        print("Note: requirements.txt changed since the baseline was recorded")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark headless renders of every portfolio section.")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh-interpreter runs per case (median is kept)")
+    parser.add_argument("--case", action="append", default=[], metavar="NAME",
+                        help="Only run cases whose name contains NAME (repeatable)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="Write this run as the new baseline")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 when a regression is found")
+    args = parser.parse_args()
+
+    cases = [case for case in CASES if not args.case or any(part in case["name"] for part in args.case)]
+    report = run(cases, args.repeat)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Wrote {args.baseline}")
+        return
+
+    try:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return
+
+    regressions = compare(report, baseline)
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+    if args.check and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+# build_assets.py
+"""
+Build step for the portfolio's static assets.
+
+Walks the asset directories, writes content-hashed copies of every file and
+resized WebP/AVIF/JPEG variants of every still raster image into
+``static/assets/``, and records everything in ``static/assets/manifest.json``.
+Animated images (GIFs) are transcoded to an animated WebP and a poster frame,
+plus muted MP4/WebM loops when ``ffmpeg`` is on the PATH. Large scans in
+``Certifications/`` and ``resumes/`` also get a Deep Zoom (DZI) tile pyramid
+under ``static/assets/dzi/`` for the zoomable viewer in ``deep_zoom.py``.
+The section renderers read that manifest through ``assets.py`` so a 100 px
+logo is served from a 200 px variant instead of the full-size original.
+
+Usage:
+    python build_assets.py            # incremental build
+    python build_assets.py --force    # rebuild every variant
+    python build_assets.py --prune    # also delete files no longer referenced
+"""
+import argparse
+import io
+import json
+import logging
+import math
+import os
+import shutil
+import subprocess
+import time
+
+from PIL import Image, ImageSequence, features
+
+from assets import (ASSET_DIR, BASE_DIR, MANIFEST_PATH, MANIFEST_VERSION, get_pdf_thumbnail_path,
+                    hash_file, relative_asset_path)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Directories (relative to the project root) that hold shipped assets
+SOURCE_DIRS = ("images", "logos", "Certifications", "resumes", "samples")
+
+# Fixed output widths for resized variants
+VARIANT_WIDTHS = (100, 200, 400, 800)
+
+# Output formats in order of preference; AVIF is skipped when Pillow lacks it
+VARIANT_FORMATS = ("avif", "webp", "jpeg")
+
+RASTER_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".gif")
+
+MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+    ".avif": "image/avif",
+    ".pdf": "application/pdf",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".ipynb": "application/x-ipynb+json",
+    ".py": "text/plain",
+}
+
+QUALITY = {"avif": 60, "webp": 80, "jpeg": 82}
+
+# Deep Zoom tile pyramids: which directories, from what size, and tile settings
+DZI_DIRS = ("Certifications", "resumes")
+DZI_MIN_SIZE = 1600
+DZI_TILE_SIZE = 254
+DZI_OVERLAP = 1
+DZI_FORMAT = "webp"
+DZI_QUALITY = 80
+
+# Animated WebP quality, and ffmpeg arguments for the looping video versions
+ANIMATION_QUALITY = 70
+VIDEO_FORMATS = {
+    "mp4": ["-c:v", "libx264", "-crf", "28", "-preset", "slow", "-pix_fmt", "yuv420p", "-movflags", "+faststart"],
+    "webm": ["-c:v", "libvpx-vp9", "-crf", "40", "-b:v", "0", "-row-mt", "1"],
+}
+
+
+def iter_source_files(root: str = BASE_DIR):
+    """Yield absolute paths of every file under the asset source directories."""
+    for source_dir in SOURCE_DIRS:
+        top = os.path.join(root, source_dir)
+        if not os.path.isdir(top):
+            continue
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if not filename.startswith("."):
+                    yield os.path.join(dirpath, filename)
+
+
+def supported_formats():
+    """Return the variant formats the installed Pillow can encode."""
+    formats = []
+    for fmt in VARIANT_FORMATS:
+        if fmt == "avif" and not features.check("avif"):
+            logger.info("Pillow was built without AVIF support; skipping AVIF variants")
+            continue
+        formats.append(fmt)
+    return formats
+
+
+def encode_variant(img: Image.Image, fmt: str) -> bytes:
+    """Encode an already-resized image in the requested format."""
+    buffer = io.BytesIO()
+    if fmt == "jpeg":
+        img.convert("RGB").save(buffer, "JPEG", quality=QUALITY[fmt], optimize=True, progressive=True)
+    elif fmt == "png":
+        img.save(buffer, "PNG", optimize=True)
+    elif fmt == "webp":
+        img.save(buffer, "WEBP", quality=QUALITY[fmt], method=6)
+    else:
+        img.save(buffer, fmt.upper(), quality=QUALITY[fmt])
+    return buffer.getvalue()
+
+
+def build_variants(src_path: str, content_hash: str, out_dir: str, formats, force: bool = False):
+    """Write resized variants of a still raster image and return their manifest records."""
+    with Image.open(src_path) as img:
+        width, height = img.size
+        if getattr(img, "n_frames", 1) > 1:
+            # Animated images keep their original bytes; resizing would drop frames
+            return width, height, []
+
+        has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+        img = img.convert("RGBA" if has_alpha else "RGB")
+
+        # Never upscale: widths beyond the original collapse to the original width
+        target_widths = sorted({min(w, width) for w in VARIANT_WIDTHS})
+        variants = []
+        for target_width in target_widths:
+            target_height = max(1, round(height * target_width / width))
+            resized = img if target_width == width else img.resize((target_width, target_height), Image.LANCZOS)
+            for fmt in formats:
+                # JPEG cannot carry transparency, so alpha images fall back to PNG
+                out_fmt = "png" if fmt == "jpeg" and has_alpha else fmt
+                ext = "jpg" if out_fmt == "jpeg" else out_fmt
+                filename = f"{content_hash}-{target_width}w.{ext}"
+                out_path = os.path.join(out_dir, filename)
+                if force or not os.path.exists(out_path):
+                    data = encode_variant(resized, out_fmt)
+                    with open(out_path, "wb") as f:
+                        f.write(data)
+                variants.append({
+                    "width": target_width,
+                    "height": target_height,
+                    "format": out_fmt,
+                    "file": filename,
+                    "bytes": os.path.getsize(out_path),
+                })
+    return width, height, variants
+
+
+def transcode_video(src_path: str, out_path: str, fmt: str) -> bool:
+    """Transcode an animated image to a muted video with ffmpeg. Returns False if it fails."""
+    tmp_path = f"{out_path}.tmp.{fmt}"
+    command = [
+        "ffmpeg", "-y", "-loglevel", "error", "-i", src_path, "-an",
+        # H.264 and VP9 in yuv420p need even dimensions
+        "-vf", "scale=trunc(iw/2)*2:trunc(ih/2)*2",
+        *VIDEO_FORMATS[fmt], tmp_path,
+    ]
+    try:
+        subprocess.run(command, check=True, capture_output=True, timeout=300)
+        os.replace(tmp_path, out_path)
+        return True
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.error(f"Error transcoding {src_path} to {fmt}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+
+def build_animation(src_path: str, content_hash: str, out_dir: str, force: bool = False):
+    """
+    Transcode an animated image and return its manifest record, or None for still images.
+
+    Writes an animated WebP and a WebP poster (first frame), plus MP4/WebM loops
+    when ffmpeg is available. Outputs are named by content hash and reused.
+    """
+    with Image.open(src_path) as img:
+        if getattr(img, "n_frames", 1) <= 1:
+            return None
+
+        webp_name = f"{content_hash}-anim.webp"
+        poster_name = f"{content_hash}-poster.webp"
+        webp_path = os.path.join(out_dir, webp_name)
+        poster_path = os.path.join(out_dir, poster_name)
+        if force or not os.path.exists(webp_path) or not os.path.exists(poster_path):
+            mode = "RGBA" if "transparency" in img.info else "RGB"
+            frames, durations = [], []
+            for frame in ImageSequence.Iterator(img):
+                frames.append(frame.convert(mode))
+                durations.append(frame.info.get("duration", img.info.get("duration", 100)) or 100)
+            frames[0].save(poster_path, "WEBP", quality=QUALITY["webp"], method=6)
+            # Mixed lossy/lossless frames suit GIF content (flat colours, small changes) best
+            frames[0].save(webp_path, "WEBP", save_all=True, append_images=frames[1:], duration=durations,
+                           loop=img.info.get("loop", 0), quality=ANIMATION_QUALITY, method=4,
+                           allow_mixed=True, minimize_size=True)
+
+        record = {
+            "frames": img.n_frames,
+            "webp": webp_name,
+            "webp_bytes": os.path.getsize(webp_path),
+            "poster": poster_name,
+        }
+
+    if shutil.which("ffmpeg"):
+        for fmt in VIDEO_FORMATS:
+            video_name = f"{content_hash}-loop.{fmt}"
+            video_path = os.path.join(out_dir, video_name)
+            if (not force and os.path.exists(video_path)) or transcode_video(src_path, video_path, fmt):
+                record[fmt] = video_name
+                record[f"{fmt}_bytes"] = os.path.getsize(video_path)
+    else:
+        logger.info(f"ffmpeg not found; {os.path.basename(src_path)} gets animated WebP only")
+    return record
+
+
+def dzi_xml(width: int, height: int) -> str:
+    """Return the ``.dzi`` descriptor of a tile pyramid."""
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<Image xmlns="http://schemas.microsoft.com/deepzoom/2008" TileSize="{DZI_TILE_SIZE}" '
+        f'Overlap="{DZI_OVERLAP}" Format="{DZI_FORMAT}"><Size Width="{width}" Height="{height}"/></Image>\n'
+    )
+
+
+def build_dzi(src_path: str, content_hash: str, out_dir: str, force: bool = False):
+    """
+    Write a Deep Zoom tile pyramid for a large scan and return its manifest record.
+
+    Level ``n`` is the full image, and each level below it halves both sides
+    down to 1x1 (level 0). Every level is cut into ``DZI_TILE_SIZE`` tiles with
+    ``DZI_OVERLAP`` px of overlap, stored as ``dzi/<hash>_files/<level>/<col>_<row>.webp``.
+
+    Returns:
+        The record, or None if the image is smaller than ``DZI_MIN_SIZE``
+    """
+    with Image.open(src_path) as img:
+        width, height = img.size
+        if max(width, height) < DZI_MIN_SIZE or getattr(img, "n_frames", 1) > 1:
+            return None
+
+        dzi_dir = os.path.join(out_dir, "dzi")
+        descriptor = f"dzi/{content_hash}.dzi"
+        descriptor_path = os.path.join(out_dir, descriptor)
+        max_level = math.ceil(math.log2(max(width, height)))
+        record = {"dzi": descriptor, "levels": max_level + 1}
+        if not force and os.path.exists(descriptor_path):
+            return record
+
+        tiles_dir = os.path.join(dzi_dir, f"{content_hash}_files")
+        if os.path.isdir(tiles_dir):
+            shutil.rmtree(tiles_dir)
+        level_img = img.convert("RGB")
+        tile_count = 0
+        for level in range(max_level, -1, -1):
+            scale = 2 ** (max_level - level)
+            level_size = (max(1, math.ceil(width / scale)), max(1, math.ceil(height / scale)))
+            if level_img.size != level_size:
+                # Halve the previous level rather than resampling the full scan each time
+                level_img = level_img.resize(level_size, Image.LANCZOS)
+            level_dir = os.path.join(tiles_dir, str(level))
+            os.makedirs(level_dir, exist_ok=True)
+            for col in range(math.ceil(level_size[0] / DZI_TILE_SIZE)):
+                for row in range(math.ceil(level_size[1] / DZI_TILE_SIZE)):
+                    box = (
+                        max(0, col * DZI_TILE_SIZE - DZI_OVERLAP),
+                        max(0, row * DZI_TILE_SIZE - DZI_OVERLAP),
+                        min(level_size[0], (col + 1) * DZI_TILE_SIZE + DZI_OVERLAP),
+                        min(level_size[1], (row + 1) * DZI_TILE_SIZE + DZI_OVERLAP),
+                    )
+                    level_img.crop(box).save(os.path.join(level_dir, f"{col}_{row}.{DZI_FORMAT}"),
+                                             "WEBP", quality=DZI_QUALITY, method=4)
+                    tile_count += 1
+
+    # Written last, so an interrupted build is redone next time
+    with open(descriptor_path, "w", encoding="utf-8") as f:
+        f.write(dzi_xml(width, height))
+    logger.info(f"{os.path.basename(src_path)}: {tile_count} deep zoom tile(s) over {max_level + 1} level(s)")
+    return record
+
+
+def build_manifest(out_dir: str = ASSET_DIR, force: bool = False, prune: bool = False) -> dict:
+    """Build every asset and write the manifest. Returns the manifest dict."""
+    os.makedirs(out_dir, exist_ok=True)
+    formats = supported_formats()
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "generated": int(time.time()),
+        "widths": list(VARIANT_WIDTHS),
+        "sources": {},
+        "assets": {},
+    }
+
+    for src_path in iter_source_files():
+        rel_path = relative_asset_path(src_path)
+        stat = os.stat(src_path)
+        content_hash = hash_file(src_path)
+        ext = os.path.splitext(src_path)[1].lower()
+
+        manifest["sources"][rel_path] = {
+            "hash": content_hash,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+        }
+        if content_hash in manifest["assets"]:
+            # Byte-identical file already processed under another name
+            continue
+
+        original_name = f"{content_hash}{ext}"
+        original_path = os.path.join(out_dir, original_name)
+        if force or not os.path.exists(original_path):
+            shutil.copyfile(src_path, original_path)
+
+        record = {
+            "mime": MIME_TYPES.get(ext, "application/octet-stream"),
+            "bytes": stat.st_size,
+            "original": original_name,
+            "variants": [],
+        }
+        if ext in RASTER_EXTENSIONS:
+            try:
+                width, height, variants = build_variants(src_path, content_hash, out_dir, formats, force)
+                record.update(width=width, height=height, variants=variants)
+            except Exception as e:
+                logger.error(f"Error building variants for {rel_path}: {e}")
+            if rel_path.split("/", 1)[0] in DZI_DIRS:
+                try:
+                    dzi = build_dzi(src_path, content_hash, out_dir, force)
+                    if dzi is not None:
+                        record.update(dzi)
+                except Exception as e:
+                    logger.error(f"Error building deep zoom tiles for {rel_path}: {e}")
+            try:
+                animation = build_animation(src_path, content_hash, out_dir, force)
+                if animation is not None:
+                    record["animation"] = animation
+            except Exception as e:
+                logger.error(f"Error transcoding animation {rel_path}: {e}")
+        elif ext == ".pdf":
+            # Pre-render the card thumbnail so the first visitor does not pay for it
+            thumb_path = get_pdf_thumbnail_path(src_path)
+            if thumb_path is not None:
+                record["thumbnail"] = os.path.relpath(thumb_path, out_dir).replace(os.sep, "/")
+
+        manifest["assets"][content_hash] = record
+        logger.info(f"{rel_path}: {len(record['variants'])} variant(s)")
+
+    if prune:
+        referenced = {"manifest.json"}
+        for record in manifest["assets"].values():
+            referenced.add(record["original"])
+            referenced.update(v["file"] for v in record["variants"])
+            if "thumbnail" in record:
+                referenced.add(record["thumbnail"])
+            animation = record.get("animation", {})
+            referenced.update(animation[key] for key in ("webp", "poster", *VIDEO_FORMATS) if key in animation)
+        # Tile pyramids of scans that are gone
+        dzi_dir = os.path.join(out_dir, "dzi")
+        live = {record["dzi"].split("/")[-1][:-len(".dzi")] for record in manifest["assets"].values() if "dzi" in record}
+        for filename in os.listdir(dzi_dir) if os.path.isdir(dzi_dir) else []:
+            if filename.split(".")[0].split("_")[0] not in live:
+                target = os.path.join(dzi_dir, filename)
+                if os.path.isdir(target):
+                    shutil.rmtree(target)
+                else:
+                    os.remove(target)
+                logger.info(f"Pruned dzi/{filename}")
+        # Stylesheet bundles other than the one the current CSS compiles to
+        css_dir = os.path.join(out_dir, "css")
+        if os.path.isdir(css_dir):
+            from style_registry import get_bundle
+
+            current = f"{get_bundle()[0]}.css"
+            for filename in os.listdir(css_dir):
+                if filename != current:
+                    os.remove(os.path.join(css_dir, filename))
+                    logger.info(f"Pruned css/{filename}")
+        for filename in os.listdir(out_dir):
+            if os.path.isdir(os.path.join(out_dir, filename)):
+                continue
+            if filename not in referenced:
+                os.remove(os.path.join(out_dir, filename))
+                logger.info(f"Pruned {filename}")
+
+    tmp_path = os.path.join(out_dir, "manifest.json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, os.path.join(out_dir, "manifest.json"))
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build content-hashed asset variants and manifest.")
+    parser.add_argument("--force", action="store_true", help="Re-encode variants that already exist")
+    parser.add_argument("--prune", action="store_true", help="Delete output files no longer in the manifest")
+    args = parser.parse_args()
+
+    manifest = build_manifest(force=args.force, prune=args.prune)
+    original_bytes = sum(record["bytes"] for record in manifest["assets"].values())
+    variant_count = sum(len(record["variants"]) for record in manifest["assets"].values())
+    logger.info(
+        f"Wrote {MANIFEST_PATH}: {len(manifest['sources'])} source file(s), "
+        f"{len(manifest['assets'])} unique asset(s), {variant_count} variant(s), "
+        f"{original_bytes / 1024:.0f} KB of originals"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+# catalog_sqlite.py
+"""
+Optional SQLite backend for the searchable catalogs, turned on with
+``PORTFOLIO_CATALOG_BACKEND=sqlite``.
+
+Each catalog is mirrored into a local database (``PORTFOLIO_CATALOG_DB``,
+``.streamlit/catalog.sqlite3`` by default):
+
+    - ``catalog_records`` holds every record as JSON, keyed by its position
+    - ``fts_<catalog>`` is an FTS5 table over the searchable fields
+    - ``catalog_terms`` holds each record's terms with their best field weight
+    - ``catalog_facets`` and ``catalog_ranks`` hold filter values and sort orders
+
+A catalog is copied into the database again only when its content or its
+search configuration changes. Search, filters, sorting and paging then run as
+indexed SQL, and only the rows of the requested page are loaded into Python.
+FTS5 finds the matching records. They are ranked by relevance with the same
+weighted term scores as ``search_index.SearchIndex``, not with ``bm25``, so
+both backends return results in the same order.
+
+This does not make memory flat in the catalog size. The records are still
+parsed from the JSON catalogs by ``catalog_store`` and kept in memory (other
+sections, global search and the sync itself read them there); what the
+backend saves is the in-memory search index and the per-query scans.
+
+The in-memory ``IndexedCatalog`` in ``search_index`` exposes the same
+``facet_values``/``query`` interface, so the section renderers work with
+either backend. Every session shares one connection, used under a lock.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from catalog_store import freeze
+from fragment_cache import record_hash
+from search_index import PREFIX_MATCH_FACTOR, _field_values, tokenize
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB_PATH = os.path.join(BASE_DIR, ".streamlit", "catalog.sqlite3")
+
+_NAME_RE = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+# Part of each catalog's signature, so databases written by older code are rebuilt
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    catalog TEXT PRIMARY KEY,
+    signature TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS catalog_records (
+    catalog TEXT NOT NULL,
+    record_id INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (catalog, record_id)
+);
+CREATE TABLE IF NOT EXISTS catalog_facets (
+    catalog TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    record_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS catalog_facets_lookup ON catalog_facets (catalog, field, value, record_id);
+CREATE TABLE IF NOT EXISTS catalog_terms (
+    catalog TEXT NOT NULL,
+    term TEXT NOT NULL,
+    record_id INTEGER NOT NULL,
+    weight REAL NOT NULL,
+    PRIMARY KEY (catalog, term, record_id)
+);
+CREATE TABLE IF NOT EXISTS catalog_ranks (
+    catalog TEXT NOT NULL,
+    sort_key TEXT NOT NULL,
+    record_id INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    PRIMARY KEY (catalog, sort_key, record_id)
+);
+CREATE INDEX IF NOT EXISTS catalog_ranks_order ON catalog_ranks (catalog, sort_key, rank);
+"""
+
+
+def _check_name(name: str) -> str:
+    """Catalog and field names end up in table and column names."""
+    if not _NAME_RE.match(name):
+        raise ValueError(f"Invalid catalog or field name: {name!r}")
+    return name
+
+
+def match_expression(query: str) -> Optional[str]:
+    """Turn a search box query into an FTS5 expression: every token, as a prefix."""
+    tokens = tokenize(query)
+    if not tokens:
+        return None
+    return " AND ".join(f'"{token}"*' for token in dict.fromkeys(tokens))
+
+
+def term_weights(record: Mapping, fields: Mapping[str, float]) -> Dict[str, float]:
+    """Each term of a record with its best field weight, as ``SearchIndex`` indexes it."""
+    weights: Dict[str, float] = {}
+    for field, weight in fields.items():
+        for value in _field_values(record, field):
+            for token in set(tokenize(value)):
+                weights[token] = max(weights.get(token, 0.0), weight)
+    return weights
+
+
+class SqliteCatalogDB:
+    """
+    One database file shared by every session, through a single connection.
+
+    Streamlit runs each script run on a new thread, so a connection per
+    thread would be opened again on every rerun.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        # catalog -> (records object, signature) last synced by this process
+        self._synced: Dict[str, Tuple[Sequence[Mapping], str]] = {}
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Hold the shared connection (opened on first use) for the ``with`` block."""
+        with self._lock:
+            if self._conn is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(SCHEMA)
+                self._conn = conn
+            yield self._conn
+
+    def sync(self, name: str, records: Sequence[Mapping], fields: Mapping[str, float],
+             sort_keys: Mapping[str, Callable[[Mapping], Any]], facets: Iterable[str]) -> None:
+        """Copy ``records`` into the database unless the stored copy is already current."""
+        cached = self._synced.get(name)
+        if cached is not None and cached[0] is records:
+            return
+
+        hashes = [record_hash(record) for record in records]
+        signature = hashlib.sha256(json.dumps(
+            [SCHEMA_VERSION, hashes, sorted(fields.items()), sorted(sort_keys), sorted(facets)]
+        ).encode("utf-8")).hexdigest()
+
+        with self.connection() as conn:
+            row = conn.execute("SELECT signature FROM catalog_meta WHERE catalog = ?", (name,)).fetchone()
+            if row is None or row[0] != signature:
+                self._write(conn, name, records, hashes, fields, sort_keys, facets, signature)
+            self._synced[name] = (records, signature)
+
+    def _write(self, conn: sqlite3.Connection, name: str, records: Sequence[Mapping], hashes: List[str],
+               fields: Mapping[str, float], sort_keys: Mapping[str, Callable[[Mapping], Any]],
+               facets: Iterable[str], signature: str) -> None:
+        fts_table = f"fts_{_check_name(name)}"
+        columns = [_check_name(field) for field in fields]
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for table in ("catalog_records", "catalog_terms", "catalog_facets", "catalog_ranks"):
+                conn.execute(f"DELETE FROM {table} WHERE catalog = ?", (name,))
+            conn.execute(f"DROP TABLE IF EXISTS {fts_table}")
+            conn.execute(f"CREATE VIRTUAL TABLE {fts_table} USING fts5({', '.join(columns)})")
+
+            conn.executemany(
+                "INSERT INTO catalog_records (catalog, record_id, content_hash, data) VALUES (?, ?, ?, ?)",
+                ((name, i, hashes[i], json.dumps(record, ensure_ascii=False)) for i, record in enumerate(records)),
+            )
+            conn.executemany(
+                f"INSERT INTO {fts_table} (rowid, {', '.join(columns)}) VALUES (?{', ?' * len(columns)})",
+                ((i, *(" ".join(_field_values(record, field)) for field in fields)) for i, record in enumerate(records)),
+            )
+            conn.executemany(
+                "INSERT INTO catalog_terms (catalog, term, record_id, weight) VALUES (?, ?, ?, ?)",
+                ((name, term, i, weight) for i, record in enumerate(records)
+                 for term, weight in term_weights(record, fields).items()),
+            )
+            for field in facets:
+                conn.executemany(
+                    "INSERT INTO catalog_facets (catalog, field, value, record_id) VALUES (?, ?, ?, ?)",
+                    ((name, field, value, i) for i, record in enumerate(records) for value in _field_values(record, field)),
+                )
+            for sort_name, key in sort_keys.items():
+                order = sorted(range(len(records)), key=lambda i: key(records[i]))
+                conn.executemany(
+                    "INSERT INTO catalog_ranks (catalog, sort_key, record_id, rank) VALUES (?, ?, ?, ?)",
+                    ((name, sort_name, record_id, rank) for rank, record_id in enumerate(order)),
+                )
+            conn.execute("INSERT OR REPLACE INTO catalog_meta (catalog, signature) VALUES (?, ?)", (name, signature))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        logger.info(f"Synced catalog {name} to {self.path}: {len(records)} record(s)")
+
+
+class SqliteCatalog:
+    """A catalog queried with SQL; same interface as ``search_index.IndexedCatalog``."""
+
+    def __init__(self, db: SqliteCatalogDB, name: str, fields: Mapping[str, float]):
+        self.db = db
+        self.name = name
+        self.fields = fields
+
+    def facet_values(self, field: str) -> List[str]:
+        """Return the distinct values of a facet field, sorted."""
+        with self.db.connection() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT value FROM catalog_facets WHERE catalog = ? AND field = ? ORDER BY value",
+                (self.name, field),
+            ).fetchall()
+        return [value for (value,) in rows]
+
+    def query(self, query: str = "", filters: Optional[Mapping[str, Sequence[str]]] = None,
+              sort: Optional[str] = None, offset: int = 0, limit: Optional[int] = None) -> Tuple[List[Mapping], int]:
+        """
+        Search, filter, sort and page the catalog.
+
+        Returns:
+            (records on the requested page, total number of matches)
+        """
+        fts_table = f"fts_{self.name}"
+        joins, where, params, order = [], ["r.catalog = ?"], [self.name], []
+
+        expression = match_expression(query)
+        if expression is not None:
+            joins.append(f"JOIN {fts_table} ON {fts_table}.rowid = r.record_id")
+            where.append(f"{fts_table} MATCH ?")
+            params.append(expression)
+
+        for field, values in (filters or {}).items():
+            if values:
+                where.append(
+                    "r.record_id IN (SELECT record_id FROM catalog_facets "
+                    f"WHERE catalog = r.catalog AND field = ? AND value IN ({', '.join('?' * len(values))}))"
+                )
+                params.extend([field, *values])
+
+        if sort is not None:
+            joins.append("JOIN catalog_ranks k ON k.catalog = r.catalog AND k.sort_key = ? AND k.record_id = r.record_id")
+            params.insert(0, sort)
+            order.append("k.rank")
+        elif expression is not None:
+            # Same scores as SearchIndex: per query token, the best weight of a
+            # matching term (prefix matches count less), summed over the tokens
+            token_scores, score_params = [], []
+            for token in dict.fromkeys(tokenize(query)):
+                token_scores.append(
+                    "SELECT record_id, MAX(weight * CASE WHEN term = ? THEN 1.0 ELSE ? END) AS score "
+                    "FROM catalog_terms WHERE catalog = ? AND term >= ? AND term < ? GROUP BY record_id"
+                )
+                score_params += [token, PREFIX_MATCH_FACTOR, self.name, token, token + "\uffff"]
+            params[:0] = score_params
+            joins.insert(0, f"LEFT JOIN (SELECT record_id, ROUND(SUM(score), 9) AS score "
+                            f"FROM ({' UNION ALL '.join(token_scores)}) GROUP BY record_id) s "
+                            "ON s.record_id = r.record_id")
+            order.append("s.score DESC")
+        order.append("r.record_id")
+
+        sql_from = f"FROM catalog_records r {' '.join(joins)} WHERE {' AND '.join(where)}"
+        with self.db.connection() as conn:
+            total = conn.execute(f"SELECT COUNT(*) {sql_from}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT r.content_hash, r.data {sql_from} ORDER BY {', '.join(order)} LIMIT ? OFFSET ?",
+                [*params, -1 if limit is None else limit, offset],
+            ).fetchall()
+
+        records = []
+        for content_hash, data in rows:
+            record = freeze(json.loads(data))
+            record.content_hash = content_hash
+            records.append(record)
+        return records, total
+
+
+_db_lock = threading.Lock()
+_databases: Dict[str, SqliteCatalogDB] = {}
+
+
+def get_sqlite_catalog(name: str, records: Sequence[Mapping], fields: Mapping[str, float],
+                       sort_keys: Optional[Mapping[str, Callable[[Mapping], Any]]] = None,
+                       facets: Iterable[str] = ()) -> SqliteCatalog:
+    """Return the SQLite view of a catalog, syncing ``records`` into the database if they changed."""
+    path = os.environ.get("PORTFOLIO_CATALOG_DB") or DEFAULT_DB_PATH
+    with _db_lock:
+        db = _databases.get(path)
+        if db is None:
+            db = _databases[path] = SqliteCatalogDB(path)
+    db.sync(_check_name(name), records, fields, sort_keys or {}, tuple(facets))
+    return SqliteCatalog(db, name, fields)
@@ -0,0 +1,242 @@
+# catalog_store.py
+"""
+Catalog data (skills, projects, certifications, resumes, experience and the
+MySQL showcase) lives in ``data/catalog/*.json`` rather than in Python
+literals, so editing a sentence no longer reloads modules.
+
+Each file looks like ``{"version": 1, "data": ...}``. ``version`` is the schema
+version of the file format. Files are validated against ``SCHEMAS`` when read
+and frozen into read-only dicts and tuples. Every session shares the result,
+and a file is parsed again only when its mtime changes. If an edited file does
+not validate, the last good version stays in use and the error is logged.
+
+Each frozen record carries the hash of its content. The fragment cache uses
+that hash for its keys, so edits to the JSON invalidate exactly the cards
+whose records changed.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOG_DIR = os.path.join(BASE_DIR, "data", "catalog")
+SCHEMA_VERSION = 1
+
+_SAMPLE = {"name": str, "description": str}
+
+# Catalog name -> schema of one record. A field maps to a type, to ``[type]``
+# for a list of that type, or to ``[{...}]`` for a list of nested records.
+# Fields ending in "?" are optional.
+SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "skills": {
+        "name": str, "logo_path": str, "version": str, "functionality": str, "use": str,
+        "samples?": [dict(_SAMPLE, **{"file_path?": str, "image_path?": str, "embed_url?": str, "query?": str})],
+    },
+    "projects": {
+        "title": str, "description": str, "duration?": str, "type?": str, "icon?": str,
+        "tags?": [str], "categories?": [str], "skills?": [str],
+        "code_file?": str, "ppt_file?": str, "video_file?": str,
+    },
+    "certifications": {
+        "title": str, "pdf": str, "description": str, "issue_date?": str, "expiry_date?": str,
+        "organization?": str, "skills?": [str], "scan?": str,
+    },
+    "resumes": {"title": str, "description": str, "file": str, "date?": str},
+    "experiences": {
+        "title": str, "company": str, "duration": str, "location?": str, "description": str,
+        "responsibilities?": [str], "logo_path?": str,
+    },
+    "mysql": {
+        "name": str, "logo_path": str, "version": str, "functionality": str, "use": str,
+        "samples": [dict(_SAMPLE, **{"query": str})],
+    },
+}
+
+# Catalogs whose file holds one record instead of a list
+SINGLE_RECORD = {"mysql"}
+
+
+class CatalogError(ValueError):
+    """Raised when a catalog file is missing, malformed or fails validation."""
+
+
+class FrozenDict(dict):
+    """Read-only dict. Still a ``dict``, so JSON, pandas and Streamlit accept it."""
+
+    content_hash: Optional[str] = None
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("catalog records are read-only")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        # copy/pickle would otherwise rebuild the dict through __setitem__
+        return FrozenDict, (dict(self),)
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to ``FrozenDict`` and lists to tuples."""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _validate_record(record: Any, schema: Dict[str, Any], where: str) -> None:
+    if not isinstance(record, dict):
+        raise CatalogError(f"{where}: expected an object, got {type(record).__name__}")
+    fields = {name.rstrip("?"): name.endswith("?") for name in schema}
+    unknown = set(record) - set(fields)
+    if unknown:
+        raise CatalogError(f"{where}: unknown field(s) {', '.join(sorted(unknown))}")
+
+    for name, spec in schema.items():
+        field, optional = name.rstrip("?"), name.endswith("?")
+        if field not in record:
+            if not optional:
+                raise CatalogError(f"{where}: missing required field {field!r}")
+            continue
+        value = record[field]
+        if isinstance(spec, list):
+            if not isinstance(value, list):
+                raise CatalogError(f"{where}.{field}: expected a list, got {type(value).__name__}")
+            for i, item in enumerate(value):
+                if isinstance(spec[0], dict):
+                    _validate_record(item, spec[0], f"{where}.{field}[{i}]")
+                elif not isinstance(item, spec[0]):
+                    raise CatalogError(f"{where}.{field}[{i}]: expected {spec[0].__name__}, got {type(item).__name__}")
+        elif not isinstance(value, spec):
+            raise CatalogError(f"{where}.{field}: expected {spec.__name__}, got {type(value).__name__}")
+
+
+def _record_hash(record: Any) -> str:
+    encoded = json.dumps(record, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def parse_catalog(name: str, text: str) -> Any:
+    """
+    Validate and freeze the JSON text of catalog ``name``.
+
+    Raises:
+        CatalogError: If the text is not valid JSON or does not match the schema
+    """
+    try:
+        document = json.loads(text)
+    except ValueError as e:
+        raise CatalogError(f"{name}: invalid JSON: {e}") from e
+    if not isinstance(document, dict) or "data" not in document:
+        raise CatalogError(f"{name}: expected an object with a 'data' field")
+    if document.get("version") != SCHEMA_VERSION:
+        raise CatalogError(f"{name}: unsupported version {document.get('version')!r} (expected {SCHEMA_VERSION})")
+
+    data = document["data"]
+    records = [data] if name in SINGLE_RECORD else data
+    if not isinstance(records, list):
+        raise CatalogError(f"{name}: 'data' must be a list")
+
+    frozen = []
+    for i, record in enumerate(records):
+        _validate_record(record, SCHEMAS[name], f"{name}[{i}]")
+        item = freeze(record)
+        item.content_hash = _record_hash(record)
+        frozen.append(item)
+    return frozen[0] if name in SINGLE_RECORD else tuple(frozen)
+
+
+class CatalogStore:
+    """Loads catalogs from ``CATALOG_DIR`` and reloads them when their file changes."""
+
+    def __init__(self, directory: str = CATALOG_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        # name -> (mtime_ns, content version, data)
+        self._catalogs: Dict[str, Tuple[int, str, Any]] = {}
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.json")
+
+    def _load(self, name: str) -> Tuple[int, str, Any]:
+        if name not in SCHEMAS:
+            raise CatalogError(f"Unknown catalog {name!r}")
+        path = self.path(name)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError as e:
+            with self._lock:
+                cached = self._catalogs.get(name)
+            if cached is None:
+                raise CatalogError(f"{name}: cannot read {path}: {e}") from e
+            logger.error(f"Keeping previous {name} catalog: {e}")
+            return cached
+
+        with self._lock:
+            cached = self._catalogs.get(name)
+            if cached is not None and cached[0] == mtime:
+                return cached
+
+            try:
+                with open(path, "rb") as f:
+                    raw = f.read()
+            except OSError as e:
+                raise CatalogError(f"{name}: cannot read {path}: {e}") from e
+            version = hashlib.sha256(raw).hexdigest()[:16]
+            if cached is not None and cached[1] == version:
+                # Touched but unchanged
+                entry = (mtime, version, cached[2])
+            else:
+                try:
+                    entry = (mtime, version, parse_catalog(name, raw.decode("utf-8")))
+                except (CatalogError, UnicodeDecodeError) as e:
+                    if cached is None:
+                        raise CatalogError(str(e)) from e
+                    # Keep serving the last good version until the file is fixed
+                    logger.error(f"Keeping previous {name} catalog: {e}")
+                    entry = (mtime, cached[1], cached[2])
+                else:
+                    logger.info(f"Loaded catalog {name} (version {version})")
+            self._catalogs[name] = entry
+            return entry
+
+    def get(self, name: str) -> Any:
+        """Return the frozen catalog ``name`` (a tuple of records, or one record)."""
+        return self._load(name)[2]
+
+    def version(self, name: str) -> str:
+        """Return the content hash of the catalog file currently in use."""
+        return self._load(name)[1]
+
+
+# Create a singleton instance
+catalog_store = CatalogStore()
+
+
+def get_catalog(name: str) -> Any:
+    """Helper function to read a catalog through the shared store"""
+    return catalog_store.get(name)
+
+
+def catalog_version(name: str) -> str:
+    """Helper function to get a catalog's content version"""
+    return catalog_store.version(name)
+
+
+def catalog_attributes(module_name: str, names: Dict[str, str]):
+    """
+    Return a module ``__getattr__`` that keeps the old variable names working,
+    e.g. ``skills.sample_skills`` -> the current "skills" catalog.
+    """
+    def __getattr__(name: str) -> Any:
+        if name in names:
+            return get_catalog(names[name])
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+    return __getattr__
@@ -1,60 +1,19 @@
 import streamlit as st
 import os
-from typing import List, Dict
-import base64
-from utils import animate_text_letter_by_letter
-
-# Sample resume data structure
-sample_resumes = [
-    {
-        "title": "Data Science",
-        "description": "Resume tailored for Data Science roles.",
-        "file": "resumes/data_science_resume.pdf",
-        "date": "2023-01-15"
-    },
-    {
-        "title": "Full Stack Developer",
-        "description": "Resume tailored for Full Stack Development roles.",
-        "file": "resumes/full_stack_resume.pdf",
-        "date": "2022-11-05"
-    },
-    {
-        "title": "Business Analyst",
-        "description": "Resume tailored for Business Analyst roles.",
-        "file": "resumes/business_analyst_resume.pdf",
-        "date": "2021-09-20"
-    },
-    {
-        "title": "Machine Learning Engineer",
-        "description": "Resume tailored for Machine Learning Engineering roles.",
-        "file": "resumes/machine_learning_resume.pdf",
-        "date": "2023-03-10"
-    },
-    {
-        "title": "Data Analyst",
-        "description": "Resume tailored for Data Analyst roles.",
-        "file": "resumes/data_analyst_resume.pdf",
-        "date": "2022-07-22"
-    },
-    {
-        "title": "Software Developer",
-        "description": "Resume tailored for Software Development roles.",
-        "file": "resumes/software_developer_resume.pdf",
-        "date": "2021-05-14"
-    },
-    {
-        "title": "AI Researcher",
-        "description": "Resume tailored for AI Research roles.",
-        "file": "resumes/ai_researcher_resume.pdf",
-        "date": "2023-02-01"
-    },
-    {
-        "title": "DevOps Engineer",
-        "description": "Resume tailored for DevOps Engineering roles.",
-        "file": "resumes/devops_engineer_resume.pdf",
-        "date": "2022-04-18"
-    }
-]
+from typing import List, Dict, Tuple
+from utils import animate_text_letter_by_letter, pdf_preview_html
+from downloads import download_link_html, render_download, render_download_button
+from style_registry import inject_styles
+from fragment_cache import cached_fragment
+from catalog_store import catalog_attributes
+from pagination import render_load_more, visible_count
+from page_assets import dedupe_images
+
+# Resumes live in data/catalog/resumes.json; ``sample_resumes`` reads the current version
+__getattr__ = catalog_attributes(__name__, {"sample_resumes": "resumes"})
+
+# Resume cards per "Load more" page (two rows of two)
+RESUME_PAGE_SIZE = 4
 
 # Function to load external CSS file
 #def load_css(file_name: str):
@@ -63,77 +22,18 @@ sample_resumes = [
 #        css = f.read()
 #    st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
 
-# Function to create a binary file downloader link
-def load_styles() -> None:
-    """Load custom CSS styles for the contact section."""
-    st.markdown("""
-    <style>
-    /* Resume Card Styling */
-    .resume-card {
-        background-color: var(--royal-secondary-bg);
-        border-radius: 10px;
-        padding: 1.5rem;
-        margin-bottom: 20px;
-        box-shadow: 0 4px 6px var(--royal-shadow);
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        text-align: center;
-        color: var(--royal-light-text); /* Ensure text color is light */
-    }
-    .resume-card h3 {
-        color: var(--royal-accent); /* Resume titles in gold */
-    }
-    .resume-card p {
-        color: var(--royal-light-text); /* Resume descriptions in light text */
-    }
-    .resume-card .stDownloadButton button {
-        background-color: var(--royal-accent);
-        color: var(--royal-dark);
-        font-weight: bold;
-    }
-    .resume-card .stDownloadButton button:hover {
-        background-color: #DAA520; /* Darker gold on hover */
-    }
-    .resume-card .stDownloadButton {
-        width: 100%;
-    }
-    </style>
-    """, unsafe_allow_html=True)
 
-# Function to create a binary file downloader link
-def get_binary_file_downloader_html(file_path: str, file_label: str = "File") -> str:
-    """Generate a download link for a binary file."""
-    try:
-        with open(file_path, "rb") as f:
-            file_data = f.read()
-        b64 = base64.b64encode(file_data).decode()
-        href = f'<a href="data:application/octet-stream;base64,{b64}" download="{os.path.basename(file_path)}" class="btn">{file_label}</a>'
-        return href
-    except Exception as e:
-        st.error(f"Error generating download link: {e}")
-        return ""
-
-# Function to create a PDF preview link
-def get_pdf_display_link(pdf_path: str) -> str:
-    """Create a base64 encoded link to preview a PDF file."""
-    try:
-        with open(pdf_path, "rb") as f:
-            base64_pdf = base64.b64encode(f.read()).decode('utf-8')
-        
-        # Create a data URL for the PDF
-        pdf_display = f'<embed src="data:application/pdf;base64,{base64_pdf}" width="100%" height="300" type="application/pdf">'
-        return pdf_display
-    except Exception as e:
-        st.error(f"Error generating PDF preview: {e}")
-        return ""
+# Function to load custom CSS styles
+def load_styles() -> None:
+    """Add the shared stylesheet (including the contact styles) to the page."""
+    inject_styles()
 
 # Main function to render the contact section
 def render_contact_section(resumes: List[Dict[str, str]]) -> None:
     """Render the simplified contact section."""
     st.markdown(f"""
     <div id='contact' class='section fade-in'>
-        <h2 style='text-align: center;'>{animate_text_letter_by_letter("Contact Me", tag='span', delay_per_letter=0.10, animation_duration=3.5)}</h2>
+        <h2 style='text-align: center;'>{animate_text_letter_by_letter("Contact Me", tag='span', delay_per_letter=0.10, animation_duration=3.5, infinite=False)}</h2>
         <div class="royal-header-particles">
             <span>😀</span><span>😊</span><span>🤩</span><span>🥳</span><span>👍</span><span>👋</span>
         </div>
@@ -153,19 +53,22 @@ def render_contact_section(resumes: List[Dict[str, str]]) -> None:
         message = st.text_area("Message")
         submit_button = st.form_submit_button("Send Message", help="Click to send your message")
         
+        message_sent = False
         if submit_button:
             if name and email and message:
                 st.success("Thanks for your message! I'll get back to you soon.")
-                
-                # Provide a resume download link
-                resume_path = "resumes/data_science_resume.pdf"  # Default resume
-                if os.path.exists(resume_path):
-                    st.markdown(get_binary_file_downloader_html(resume_path, "Download Resume"), unsafe_allow_html=True)
-                else:
-                    st.error("Resume file not found.")
+                message_sent = True
             else:
                 st.warning("Please fill in all fields before submitting.")
 
+    # Provide a resume download link (download buttons are not allowed inside forms)
+    if message_sent:
+        resume_path = "resumes/data_science_resume.pdf"  # Default resume
+        if os.path.exists(resume_path):
+            render_download(resume_path, "Download Resume", key="contact_form_resume_download")
+        else:
+            st.error("Resume file not found.")
+
     # Add an interactive map
     st.markdown("<h3 style='color: var(--royal-accent);'>📍 My Location</h3>", unsafe_allow_html=True)
     st.markdown("""
@@ -188,9 +91,11 @@ def render_contact_section(resumes: List[Dict[str, str]]) -> None:
     # Load custom styles for resume cards
     load_styles()
 
-    # Display resumes side by side
+    # Display resumes side by side, building only the cards on the visible pages
     num_cols = 2  # Two resumes per row
-    rows = [resumes[i:i + num_cols] for i in range(0, len(resumes), num_cols)]
+    visible = visible_count("resumes_grid", RESUME_PAGE_SIZE)
+    shown = resumes[:visible]
+    rows = [shown[i:i + num_cols] for i in range(0, len(shown), num_cols)]
     
     for row in rows:
         cols = st.columns(num_cols)
@@ -198,30 +103,58 @@ def render_contact_section(resumes: List[Dict[str, str]]) -> None:
             with cols[i]:
                 render_resume_card(resume)
 
-# Function to render an individual resume card
-def render_resume_card(resume: Dict[str, str]) -> None:
-    """Render an individual resume card with preview and download options."""
+    render_load_more("resumes_grid", len(shown), len(resumes), RESUME_PAGE_SIZE)
+
+# Function to build the HTML of a resume card (cached across sessions)
+def build_resume_card(resume: Dict[str, str]) -> Tuple[str, bool, List[str]]:
+    """
+    Build a resume card.
+
+    Returns:
+        The card HTML, whether a download button is needed after the card
+        (no static URL to link to), and any error messages to show
+    """
     icon = get_icon_for_resume(resume['title'])
     description_html = f"<p>{resume['description']}</p>" if 'description' in resume else ""
 
-    pdf_preview_html = ""
+    preview_html = ""
     download_button_html = ""
+    errors = []
 
-    if os.path.exists(resume['file']):
-        pdf_preview_html = get_pdf_display_link(resume['file'])
-        download_button_html = get_binary_file_downloader_html(resume['file'], "Download Resume")
+    file_exists = os.path.exists(resume['file'])
+    if file_exists:
+        try:
+            preview_html = pdf_preview_html(resume['file'], width="100%")
+        except Exception as e:
+            errors.append(f"Error generating PDF preview: {e}")
+        try:
+            download_button_html = download_link_html(resume['file'], "Download Resume") or ""
+        except OSError as e:
+            errors.append(f"Error generating download link: {e}")
     else:
-        pdf_preview_html = "<p style='color: red;'>Resume file not found.</p>"
+        preview_html = "<p style='color: red;'>Resume file not found.</p>"
 
     card_html = f"""
     <div class='resume-card card'>
         <h3>{icon} {resume['title']}</h3>
         {description_html}
-        {pdf_preview_html}
+        {preview_html}
         {download_button_html}
     </div>
     """
-    st.markdown(card_html, unsafe_allow_html=True)
+    return card_html, file_exists and not download_button_html, errors
+
+# Function to render an individual resume card
+def render_resume_card(resume: Dict[str, str]) -> None:
+    """Render an individual resume card with preview and download options."""
+    card_html, needs_button, errors = cached_fragment("resume_card", resume, build_resume_card, files=[resume['file']])
+    for error in errors:
+        st.error(error)
+    st.markdown(dedupe_images(card_html), unsafe_allow_html=True)
+
+    if needs_button:
+        # No static URL to link to: use a button that reads the PDF only when clicked
+        render_download_button(resume['file'], "Download Resume", key=f"resume_download_{resume['title']}")
 
 # Function to select an appropriate icon based on resume title
 def get_icon_for_resume(title: str) -> str:
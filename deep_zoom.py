@@ -0,0 +1,70 @@
+# deep_zoom.py
+"""
+Zoomable viewer for large scans (certificates, resumes).
+
+``build_assets.py`` cuts each large scan into a Deep Zoom (DZI) tile pyramid
+under ``static/assets/dzi/``. The viewer is OpenSeadragon, loaded from a CDN
+inside ``components.html``. It requests only the tiles covering the visible
+area at the current zoom, so a multi-megabyte scan is shown for a few dozen
+KB. It is rendered only after the visitor switches it on, and only when
+static serving is available to serve the tiles.
+"""
+import json
+import logging
+import os
+from typing import Optional
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from assets import ASSET_DIR, STATIC_URL_PREFIX, get_asset_record, static_serving_enabled
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+OPENSEADRAGON_URL = "https://cdn.jsdelivr.net/npm/openseadragon@4.1.1/build/openseadragon/"
+VIEWER_HEIGHT = 520
+
+
+def get_dzi_url(path: str) -> Optional[str]:
+    """Return the static URL of a scan's ``.dzi`` descriptor, or None if there is no pyramid to serve."""
+    if not static_serving_enabled():
+        return None
+    record = get_asset_record(path)
+    if not record or "dzi" not in record:
+        return None
+    if not os.path.exists(os.path.join(ASSET_DIR, record["dzi"])):
+        return None
+    return f"{STATIC_URL_PREFIX}assets/{record['dzi']}"
+
+
+def viewer_html(dzi_url: str, height: int = VIEWER_HEIGHT) -> str:
+    """HTML of an OpenSeadragon viewer for one tile pyramid."""
+    config = json.dumps({"dzi": dzi_url, "prefix": f"{OPENSEADRAGON_URL}images/"})
+    return f"""
+    <div id="deep-zoom" style="width: 100%; height: {height - 10}px; background: #000033; border: 1px solid #FFD700;"></div>
+    <script src="{OPENSEADRAGON_URL}openseadragon.min.js"></script>
+    <script>
+        const cfg = {config};
+        OpenSeadragon({{
+            id: "deep-zoom",
+            prefixUrl: cfg.prefix,
+            // The component iframe has no URL of its own; resolve against the app page
+            tileSources: new URL(cfg.dzi, window.parent.location.href).href,
+            showNavigator: true,
+            visibilityRatio: 1,
+            maxZoomPixelRatio: 2,
+        }});
+    </script>
+    """
+
+
+# Function to show the zoom toggle and, once switched on, the viewer (reruns on its own)
+@st.fragment
+def render_scan_viewer(path: str, key: str, label: str = "🔍 Zoom into the scan") -> None:
+    dzi_url = get_dzi_url(path)
+    if dzi_url is None:
+        return
+    if st.toggle(label, key=key):
+        components.html(viewer_html(dzi_url), height=VIEWER_HEIGHT)
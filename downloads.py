@@ -0,0 +1,81 @@
+# downloads.py
+"""
+Download handles that leave file bytes on disk until a visitor clicks.
+
+With static serving on, downloads are plain links to the fingerprinted file
+under ``app/static/assets/``. The web server streams those from disk in
+chunks, and rendering the page never reads the file. Otherwise a
+``st.download_button`` is used with a callable as its data, so Streamlit
+reads the file only when the button is pressed.
+"""
+import logging
+import os
+from typing import Optional
+
+import streamlit as st
+from streamlit.errors import StreamlitAPIException
+
+from assets import asset_url, guess_mime, static_serving_enabled
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _read_file(file_path: str):
+    """Return a callable that reads ``file_path`` when invoked."""
+    def read() -> bytes:
+        with open(file_path, "rb") as f:
+            return f.read()
+    return read
+
+
+def download_link_html(file_path: str, label: str) -> Optional[str]:
+    """
+    Return an ``<a download>`` link to the file's static URL.
+
+    Returns:
+        The link HTML, or None when static serving is off (use
+        ``render_download_button`` instead)
+
+    Raises:
+        OSError: If the file does not exist
+    """
+    if not static_serving_enabled():
+        return None
+    return f'<a href="{asset_url(file_path)}" download="{os.path.basename(file_path)}" class="btn">{label}</a>'
+
+
+def render_download_button(file_path: str, label: str, mime: Optional[str] = None,
+                           key: Optional[str] = None) -> None:
+    """Render a ``st.download_button`` whose data is read only on click."""
+    file_name = os.path.basename(file_path)
+    mime = mime or guess_mime(file_path)
+    key = key or f"download_{file_path}"
+    try:
+        st.download_button(label=label, data=_read_file(file_path), file_name=file_name, mime=mime, key=key)
+    except StreamlitAPIException:
+        # Older Streamlit releases cannot defer data: ask before reading the file
+        prepared_key = f"{key}_prepared"
+        if st.session_state.get(prepared_key):
+            st.download_button(label=label, data=_read_file(file_path)(), file_name=file_name, mime=mime, key=key)
+        elif st.button(f"Prepare {label.lower()}", key=f"{key}_prepare"):
+            st.session_state[prepared_key] = True
+            st.rerun()
+
+
+def render_download(file_path: str, label: str, mime: Optional[str] = None,
+                    key: Optional[str] = None) -> None:
+    """Render a lazy download for ``file_path``: a static link if possible, else a deferred button."""
+    if not os.path.exists(file_path):
+        st.error(f"File not found: {os.path.basename(file_path)}")
+        return
+    try:
+        link_html = download_link_html(file_path, label)
+    except OSError as e:
+        logger.error(f"Error publishing {file_path}: {e}")
+        link_html = None
+    if link_html:
+        st.markdown(link_html, unsafe_allow_html=True)
+    else:
+        render_download_button(file_path, label, mime=mime, key=key)
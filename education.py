@@ -1,22 +1,11 @@
 import streamlit as st
-import requests
-import plotly.express as px
-import pandas as pd
-import base64
 import os
 from utils import animate_text_letter_by_letter
+from assets import image_src
+from page_assets import dedupe_images
+from style_registry import inject_styles
 
 # === Utility Functions ===
-@st.cache_data
-def get_image_base64(image_path):
-    """Encodes an image to base64 for embedding in HTML."""
-    try:
-        with open(image_path, "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode()
-    except FileNotFoundError:
-        st.error(f"Image not found: {image_path}")
-        return ""
-
 def load_image(path):
     """Load images with error handling."""
     try:
@@ -25,53 +14,19 @@ def load_image(path):
         st.write("Image Unavailable")
 
 # === Custom CSS Styling ===
+
 def load_styles():
-    """Load custom CSS styles for the education section."""
-    st.markdown("""
-        <style>
-        /* General Styling */
-        hr {
-            border: none;
-            border-top: 2px solid var(--royal-accent); /* Use royal accent color */
-            margin: 20px 0;
-        }
-        .header-description {
-            text-align: center;
-            font-size: 18px;
-            margin-bottom: 20px;
-            color: var(--royal-light-text); /* Use royal light text color */
-        }
-        /* Education Card Styling */
-        .education-card {
-            background-color: var(--royal-secondary-bg); /* Use royal secondary background */
-            border-radius: 10px;
-            padding: 1.5rem;
-            margin-bottom: 20px; /* Space between cards */
-            box-shadow: 0 4px 6px var(--royal-shadow); /* Use royal shadow */
-            display: flex; /* To align logo and text */
-            align-items: flex-start; /* Align items to the top */
-            color: var(--royal-light-text); /* Default text color for card content */
-        }
-        .education-card h3 {
-            color: var(--royal-accent); /* Headings in gold */
-        }
-        .education-card p b {
-            color: var(--royal-accent); /* Bold text in gold */
-        }
-        .education-logo-container {
-            flex-shrink: 0; /* Prevent logo from shrinking */
-            margin-right: 20px; /* Space between logo and text */
-        }
-        .education-details-content {
-            flex-grow: 1; /* Allow content to take available space */
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    """Add the shared stylesheet (including the education styles) to the page."""
+    inject_styles()
 
 # === Data Visualization ===
 @st.cache_data
 def create_education_chart(theme_mode="light"):
     """Create an interactive academic performance chart."""
+    # Imported here so the other sections never pay for plotly/pandas
+    import plotly.express as px
+    import pandas as pd
+
     education_data = pd.DataFrame({
         'Year': [2018, 2019, 2020, 2021, 2022],
         'SGPA': [7.0, 7.2, 7.5, 8.0, 9.18]
@@ -113,14 +68,14 @@ def create_education_chart(theme_mode="light"):
 def display_education_details():
     """Display detailed education information."""
     # B.Tech details
-    aits_logo_base64 = get_image_base64("logos/aits_logo.png")
-    jntua_logo_base64 = get_image_base64("logos/jntua_logo.png")
+    aits_logo_src = image_src("logos/aits_logo.png", width=50)
+    jntua_logo_src = image_src("logos/jntua_logo.png", width=50)
 
-    st.markdown(f"""
+    st.markdown(dedupe_images(f"""
     <div class="education-card card">
         <div class="education-logo-container">
-            <img src="data:image/png;base64,{aits_logo_base64}" width="50" style="margin-bottom: 10px;">
-            <img src="data:image/png;base64,{jntua_logo_base64}" width="50">
+            <img src="{aits_logo_src}" width="50" style="margin-bottom: 10px;">
+            <img src="{jntua_logo_src}" width="50">
         </div>
         <div class="education-details-content">
             <h3>B.Tech - CSE</h3>
@@ -132,14 +87,14 @@ def display_education_details():
             <p><b>Description</b>: During my undergraduate studies, I developed strong foundations in computer science and engineering principles, with a focus on software development, data structures, and algorithms.</p>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """), unsafe_allow_html=True)
 
     # Higher Secondary details
-    bie_ap_logo_base64 = get_image_base64("logos/bie_ap_logo.png")
-    st.markdown(f"""
+    bie_ap_logo_src = image_src("logos/bie_ap_logo.png", width=50)
+    st.markdown(dedupe_images(f"""
     <div class="education-card card">
         <div class="education-logo-container">
-            <img src="data:image/png;base64,{bie_ap_logo_base64}" width="50">
+            <img src="{bie_ap_logo_src}" width="50">
         </div>
         <div class="education-details-content">
             <h3>Higher Secondary - 12th Class (PCM)</h3>
@@ -150,14 +105,14 @@ def display_education_details():
             <p><b>Description</b>: In high school, I studied Physics, Chemistry, and Mathematics, which provided me with a strong analytical and problem-solving skill set.</p>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """), unsafe_allow_html=True)
 
     # Secondary details
-    bse_ap_logo_base64 = get_image_base64("logos/bse_ap_logo.png")
-    st.markdown(f"""
+    bse_ap_logo_src = image_src("logos/bse_ap_logo.png", width=50)
+    st.markdown(dedupe_images(f"""
     <div class="education-card card">
         <div class="education-logo-container">
-            <img src="data:image/png;base64,{bse_ap_logo_base64}" width="50">
+            <img src="{bse_ap_logo_src}" width="50">
         </div>
         <div class="education-details-content">
             <h3>Secondary - 10th Class</h3>
@@ -168,7 +123,7 @@ def display_education_details():
             <p><b>Description</b>: In secondary school, I excelled in my studies, particularly in subjects like Mathematics and Science, which laid the groundwork for my future academic pursuits.</p>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """), unsafe_allow_html=True)
 
 def education_section():
     """Main function to render the education section."""
@@ -178,7 +133,7 @@ def education_section():
     # Section Header with Animation
     st.markdown(f"""
     <div id='education' class='section fade-in'>
-        <h2 style='text-align: center;'>{animate_text_letter_by_letter("Education", tag='span', delay_per_letter=0.10, animation_duration=3.5)}</h2>
+        <h2 style='text-align: center;'>{animate_text_letter_by_letter("Education", tag='span', delay_per_letter=0.10, animation_duration=3.5, infinite=False)}</h2>
         <div class="royal-header-particles">
             <span>🎓</span><span>📚</span><span>✏️</span><span>💡</span><span>🧠</span><span>✨</span><span>🌟</span><span>📖</span><span>🧑‍🎓</span>
         </div>
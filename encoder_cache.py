@@ -0,0 +1,116 @@
+# encoder_cache.py
+"""
+Process-wide cache of base64-encoded file contents.
+
+Every session shares one cache. Entries are keyed on (path, size, mtime), so an
+edited file is re-encoded on its next use. The cache holds at most
+``PORTFOLIO_ENCODER_CACHE_BYTES`` bytes of encoded text (64 MB by default) and
+evicts the least recently used entries beyond that. Values are immutable
+``str`` objects handed out as-is, without the pickle round-trip that
+``st.cache_data`` performs on every hit.
+"""
+import base64
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class EncoderCache:
+    """Thread-safe, byte-budgeted LRU cache of base64-encoded files."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def encode(self, path: str) -> str:
+        """
+        Return the base64 encoding of a file's contents.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            encoded = self._entries.get(key)
+            if encoded is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return encoded
+            self.misses += 1
+
+        # Encode outside the lock so a large file does not block other sessions
+        with open(path, "rb") as f:
+            encoded = base64.b64encode(f.read()).decode("ascii")
+
+        if len(encoded) > self.max_bytes:
+            return encoded
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = encoded
+                self._size += len(encoded)
+                self._evict()
+        return encoded
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits its budget."""
+        while self._size > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the byte budget, evicting entries if it shrank."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return entry count, bytes held, budget and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def _budget_from_env() -> int:
+    value = os.environ.get("PORTFOLIO_ENCODER_CACHE_BYTES")
+    if not value:
+        return DEFAULT_MAX_BYTES
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid PORTFOLIO_ENCODER_CACHE_BYTES={value!r}")
+        return DEFAULT_MAX_BYTES
+
+
+# Create a singleton instance
+encoder_cache = EncoderCache(max_bytes=_budget_from_env())
+
+
+def encode_file(path: str) -> str:
+    """Helper function to base64-encode a file through the shared cache"""
+    return encoder_cache.encode(path)
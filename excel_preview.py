@@ -0,0 +1,294 @@
+# excel_preview.py
+"""
+Paged, cached previews of ``.xlsx`` work samples.
+
+Workbooks are read with openpyxl in read-only (streaming) mode. Each sheet is
+converted once into a Parquet sidecar under ``.streamlit/excel_cache/``, keyed
+by the workbook's content hash. Every later page view reads one row group from
+that sidecar instead of parsing the workbook again. Only the requested page is
+sent to the browser.
+
+Each column gets one Arrow type for the whole sheet, inferred from a first pass
+over its cells. Numbers, booleans, dates and times keep their types, so pages
+read from the sidecar match the ones streamed from the workbook. Only columns
+that really mix kinds of values (e.g. text and numbers) are stored as text.
+
+If pyarrow is not installed, pages are streamed straight from the workbook with
+openpyxl instead. This is slower for deep pages, but still row-limited.
+"""
+import itertools
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime, time
+from typing import Dict, List, Optional, Set
+
+import streamlit as st
+
+from assets import BASE_DIR, content_hash
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(BASE_DIR, ".streamlit", "excel_cache")
+# Bumped when the sidecar layout changes, so old sidecars are rebuilt
+SIDECAR_VERSION = 2
+
+# Rows per Parquet row group; a page never spans more than two groups
+ROW_GROUP_SIZE = 10_000
+DEFAULT_PAGE_SIZE = 100
+
+_build_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _open_workbook(xlsx_path: str):
+    from openpyxl import load_workbook
+
+    return load_workbook(xlsx_path, read_only=True, data_only=True)
+
+
+def _column_names(header_row) -> List[str]:
+    """Turn a header row into unique, non-empty column names."""
+    names, seen = [], {}
+    for i, value in enumerate(header_row):
+        name = str(value).strip() if value is not None and str(value).strip() else f"Column {i + 1}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _cell_text(value) -> Optional[str]:
+    """Text of a cell in a column that mixes kinds of values."""
+    if value is None:
+        return None
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _cell_kind(value) -> Optional[str]:
+    """Kind of value openpyxl returned for a cell (None for an empty cell)."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int" if -2 ** 63 <= value < 2 ** 63 else "float"
+    if isinstance(value, float):
+        return "float"
+    # datetime is a subclass of date
+    if isinstance(value, datetime):
+        return "datetime"
+    if isinstance(value, date):
+        return "date"
+    if isinstance(value, time):
+        return "time"
+    return "string"
+
+
+def _column_type(kinds: Set[str]):
+    """Arrow type for a column holding ``kinds`` of values; text when they do not share one."""
+    import pyarrow as pa
+
+    if kinds == {"bool"}:
+        return pa.bool_()
+    if kinds == {"int"}:
+        return pa.int64()
+    if kinds and kinds <= {"int", "float"}:
+        return pa.float64()
+    if kinds == {"date"}:
+        return pa.date32()
+    if kinds and kinds <= {"datetime", "date"}:
+        return pa.timestamp("us")
+    if kinds == {"time"}:
+        return pa.time64("us")
+    return pa.string()
+
+
+def _column_values(values, arrow_type) -> list:
+    """Convert one column of a row group to values of its Arrow type."""
+    import pyarrow as pa
+
+    if pa.types.is_string(arrow_type):
+        return [_cell_text(value) for value in values]
+    if pa.types.is_floating(arrow_type):
+        return [None if value is None else float(value) for value in values]
+    if pa.types.is_timestamp(arrow_type):
+        return [datetime.combine(value, time()) if type(value) is date else value for value in values]
+    return list(values)
+
+
+def _sidecar_dir(xlsx_path: str) -> str:
+    return os.path.join(CACHE_DIR, f"{content_hash(xlsx_path)}-v{SIDECAR_VERSION}")
+
+
+def get_sheet_info(xlsx_path: str) -> List[Dict]:
+    """
+    Return ``[{"name", "rows", "columns"}]`` for every sheet, building the
+    Parquet sidecars on first use when pyarrow is available.
+    """
+    sidecar_dir = _sidecar_dir(xlsx_path)
+    index_path = os.path.join(sidecar_dir, "index.json")
+    if os.path.exists(index_path):
+        with open(index_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        # No sidecars: report sheet names only, rows are counted while paging
+        wb = _open_workbook(xlsx_path)
+        try:
+            return [{"name": name, "rows": None, "columns": None} for name in wb.sheetnames]
+        finally:
+            wb.close()
+
+    with _locks_guard:
+        lock = _build_locks.setdefault(sidecar_dir, threading.Lock())
+    with lock:
+        if os.path.exists(index_path):
+            with open(index_path, encoding="utf-8") as f:
+                return json.load(f)
+        return _build_sidecars(xlsx_path, sidecar_dir)
+
+
+def _build_sidecars(xlsx_path: str, sidecar_dir: str) -> List[Dict]:
+    """
+    Stream every sheet into a Parquet file, one row group at a time.
+
+    Each sheet is read twice: once to infer the column types, once to write.
+    Memory use stays at one row group either way.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    os.makedirs(sidecar_dir, exist_ok=True)
+    sheets = []
+    wb = _open_workbook(xlsx_path)
+    try:
+        for sheet_index, ws in enumerate(wb.worksheets):
+            rows = ws.iter_rows(values_only=True)
+            columns = _column_names(next(rows, None) or [])
+            kinds = [set() for _ in columns]
+            for row in rows:
+                for i, value in enumerate(row[:len(columns)]):
+                    kind = _cell_kind(value)
+                    if kind is not None:
+                        kinds[i].add(kind)
+            schema = pa.schema([(name, _column_type(kinds[i])) for i, name in enumerate(columns)])
+
+            rows = ws.iter_rows(values_only=True)
+            next(rows, None)
+            out_path = os.path.join(sidecar_dir, f"{sheet_index}.parquet")
+            row_count = 0
+            with pq.ParquetWriter(f"{out_path}.tmp", schema) as writer:
+                while True:
+                    batch = list(itertools.islice(rows, ROW_GROUP_SIZE))
+                    if not batch:
+                        break
+                    data = {
+                        name: _column_values((row[i] if i < len(row) else None for row in batch), schema.field(i).type)
+                        for i, name in enumerate(columns)
+                    }
+                    writer.write_table(pa.Table.from_pydict(data, schema=schema), row_group_size=ROW_GROUP_SIZE)
+                    row_count += len(batch)
+            os.replace(f"{out_path}.tmp", out_path)
+            sheets.append({"name": ws.title, "rows": row_count, "columns": len(columns)})
+    finally:
+        wb.close()
+
+    with open(os.path.join(sidecar_dir, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(sheets, f)
+    logger.info(f"Built Excel preview sidecars for {xlsx_path}")
+    return sheets
+
+
+def read_page(xlsx_path: str, sheet_index: int, page: int, page_size: int = DEFAULT_PAGE_SIZE):
+    """
+    Return one page of a sheet as a DataFrame.
+
+    Args:
+        xlsx_path: Path to the workbook
+        sheet_index: Zero-based sheet index
+        page: Zero-based page number
+        page_size: Rows per page
+    """
+    import pandas as pd
+
+    start = page * page_size
+    sidecar_path = os.path.join(_sidecar_dir(xlsx_path), f"{sheet_index}.parquet")
+    if os.path.exists(sidecar_path):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(sidecar_path)
+        groups, offset, first_group_start = [], 0, None
+        for i in range(parquet_file.num_row_groups):
+            group_rows = parquet_file.metadata.row_group(i).num_rows
+            if offset + group_rows > start and offset < start + page_size:
+                groups.append(i)
+                if first_group_start is None:
+                    first_group_start = offset
+            offset += group_rows
+        if not groups:
+            return pd.DataFrame(columns=parquet_file.schema_arrow.names)
+        table = parquet_file.read_row_groups(groups)
+        table = table.slice(start - first_group_start, page_size)
+        return table.to_pandas()
+
+    # No sidecar: stream rows and keep only the requested page
+    wb = _open_workbook(xlsx_path)
+    try:
+        rows = wb.worksheets[sheet_index].iter_rows(values_only=True)
+        columns = _column_names(next(rows, None) or [])
+        page_rows = list(itertools.islice(rows, start, start + page_size))
+    finally:
+        wb.close()
+    page_rows = [tuple(row[:len(columns)]) + (None,) * (len(columns) - len(row)) for row in page_rows]
+    return pd.DataFrame(page_rows, columns=columns)
+
+
+def render_excel_preview(xlsx_path: str, key: str, page_size: int = DEFAULT_PAGE_SIZE) -> None:
+    """Render a sheet selector, a page selector and the selected page of a workbook."""
+    sheets = get_sheet_info(xlsx_path)
+    if not sheets:
+        st.info("This workbook has no sheets.")
+        return
+
+    sheet_index = 0
+    if len(sheets) > 1:
+        sheet_index = st.selectbox(
+            "Sheet",
+            options=range(len(sheets)),
+            format_func=lambda i: sheets[i]["name"],
+            key=f"{key}_sheet",
+        )
+
+    total_rows = sheets[sheet_index]["rows"]
+    if total_rows is not None:
+        page_count = max(1, -(-total_rows // page_size))
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1,
+                               key=f"{key}_page_{sheet_index}") - 1
+    else:
+        page_count = None
+        page = st.number_input("Page", min_value=1, value=1, step=1, key=f"{key}_page_{sheet_index}") - 1
+
+    df = read_page(xlsx_path, sheet_index, page, page_size)
+    st.dataframe(df)
+
+    first_row = page * page_size + 1
+    if total_rows == 0:
+        st.caption("This sheet is empty.")
+    elif total_rows is not None:
+        last_row = min(total_rows, first_row + page_size - 1)
+        st.caption(f"Rows {first_row:,}–{last_row:,} of {total_rows:,} (page {page + 1} of {page_count})")
+    elif len(df):
+        st.caption(f"Rows {first_row:,}–{first_row + len(df) - 1:,}")
+    else:
+        st.caption("No rows on this page.")
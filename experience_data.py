@@ -1,28 +1,4 @@
-sample_experiences = [
-    {
-        "title": "Junior Content Writer",
-        "company": "Rapyder",
-        "duration": "April 2025 - Present",
-        "location": "Bengaluru, India",
-        "description": "Data Science Enthusiast | Specializing in GenAI Content Creation at Rapyder Cloud Solutions #RapyDear",
-        "responsibilities": [
-            "Crafting engaging and informative content related to data science, AI, and cloud technologies.",
-            "Developing content strategies for various platforms, including blogs, social media, and marketing materials.",
-            "Collaborating with technical teams to ensure accuracy and relevance of content."
-        ],
-        "logo_path": "logos/Rapyder_logo.png"
-    },
-    {
-        "title": "Data Science Intern",
-        "company": "AI Variant",
-        "duration": "March 2023 - June 2023",
-        "location": "Remote",
-        "description": "During this internship, I developed several data-driven applications. Key projects included an oil price prediction app (achieving <2% variance), a real/fake news detection web app using NLP, and a Google Play Store app rating prediction model (93% accuracy).",
-        "responsibilities": [
-            "Developed an oil price prediction app using Python and yfinance, achieving a variance of less than 2%.",
-            "Created a fake news detection web app leveraging Natural Language Processing (NLP) techniques.",
-            "Analyzed Google Play Store app data to build a rating prediction model with 93% accuracy."
-        ],
-        "logo_path": "logos/Aivariant_logo.jpg"
-    }
-]
+from catalog_store import catalog_attributes
+
+# Experience entries live in data/catalog/experiences.json; ``sample_experiences`` reads the current version
+__getattr__ = catalog_attributes(__name__, {"sample_experiences": "experiences"})
@@ -0,0 +1,169 @@
+# fragment_cache.py
+"""
+Process-wide cache of rendered card HTML.
+
+Card builders are pure functions from a record (a skill, project,
+certificate...) to the HTML they emit. Every session shares one cache. Each
+entry is keyed by:
+
+    - a hash of the record's content (computed once per catalog version for
+      records loaded through ``catalog_store``)
+    - the mtimes of the files the record references (logos, PDFs, downloads)
+    - the asset version (static serving on/off and the asset manifest's mtime),
+      since both change the URLs embedded in the HTML
+    - any extra values the caller passes, e.g. today's date for expiry badges
+
+Editing a record or touching one of its files produces a new key, so a card
+is rebuilt once per change rather than once per visitor per rerun. At most
+``PORTFOLIO_FRAGMENT_CACHE_ENTRIES`` entries (1024 by default) holding at most
+``PORTFOLIO_FRAGMENT_CACHE_BYTES`` bytes of text (64 MB by default) are kept,
+and the least recently used are evicted first. The byte budget matters without
+static serving, where cards embed their images as data URIs.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from assets import asset_version
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def record_hash(record: Any) -> str:
+    """Stable hash of a JSON-like record (dict key order does not matter)."""
+    # Catalog records are frozen with their hash precomputed (see catalog_store)
+    precomputed = getattr(record, "content_hash", None)
+    if precomputed is not None:
+        return precomputed
+    encoded = json.dumps(record, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def file_versions(paths: Iterable[Optional[str]]) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """Return ``(path, mtime_ns)`` for each path; missing files map to None."""
+    versions = []
+    for path in paths:
+        if not path:
+            continue
+        try:
+            versions.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            versions.append((path, None))
+    return tuple(versions)
+
+
+def fragment_size(fragment: Any) -> int:
+    """Approximate size of a fragment: the length of the text it holds."""
+    if isinstance(fragment, (str, bytes)):
+        return len(fragment)
+    if isinstance(fragment, (tuple, list)):
+        return sum(fragment_size(item) for item in fragment)
+    if isinstance(fragment, dict):
+        return sum(fragment_size(key) + fragment_size(value) for key, value in fragment.items())
+    return 0
+
+
+class FragmentCache:
+    """Thread-safe LRU cache of built fragments, bounded by entry count and size."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (fragment, size)
+        self._entries: "OrderedDict[tuple, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, namespace: str, record: Any, builder: Callable[[Any], Any],
+                     files: Iterable[Optional[str]] = (), extra: Tuple = ()) -> Any:
+        """
+        Return the cached fragment for ``record``, calling ``builder(record)`` on a miss.
+
+        Args:
+            namespace: Name of the card type (keeps builders from sharing entries)
+            record: The data the fragment is built from
+            builder: Pure function of ``record``; it must not call Streamlit
+            files: Paths the fragment embeds or links to
+            extra: Any other values the output depends on
+        """
+        key = (namespace, record_hash(record), file_versions(files), asset_version(), extra)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+
+        # Build outside the lock; two sessions racing on a cold key both build it once
+        fragment = builder(record)
+
+        size = fragment_size(fragment)
+        if size > self.max_bytes:
+            return fragment
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (fragment, size)
+                self._size += size
+                self._evict()
+        return fragment
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits its limits."""
+        while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._size -= size
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return entry count, bytes held, limits and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def _limit_from_env(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}")
+        return default
+
+
+# Create a singleton instance
+fragment_cache = FragmentCache(
+    max_entries=_limit_from_env("PORTFOLIO_FRAGMENT_CACHE_ENTRIES", DEFAULT_MAX_ENTRIES),
+    max_bytes=_limit_from_env("PORTFOLIO_FRAGMENT_CACHE_BYTES", DEFAULT_MAX_BYTES),
+)
+
+
+def cached_fragment(namespace: str, record: Any, builder: Callable[[Any], Any],
+                    files: Iterable[Optional[str]] = (), extra: Tuple = ()) -> Any:
+    """Helper function to build a fragment through the shared cache"""
+    return fragment_cache.get_or_build(namespace, record, builder, files=files, extra=extra)
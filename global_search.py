@@ -0,0 +1,109 @@
+# global_search.py
+"""
+One search box over skills, projects, certifications, experience and resumes.
+
+The catalogs are merged into a single ``TrigramIndex`` so misspelled queries
+("pyhton", "tablaeu") still find their records. Each hit links to the section
+that owns it. The records are read from ``catalog_store``'s JSON catalogs, so
+searching imports no section modules. The index is built the first time
+someone searches and is shared by every session. It is rebuilt only when one
+of the catalogs changes (i.e. its file is edited).
+"""
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import streamlit as st
+
+from catalog_store import get_catalog
+from search_index import TrigramIndex, _field_values
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MAX_HITS = 8
+SESSION_KEY = "global_search_query"
+
+# Section -> (catalog name, title field, {field: weight})
+CATALOGS = {
+    "Skills": ("skills", "name", {"name": 3.0, "functionality": 1.0, "use": 1.0}),
+    "Projects": ("projects", "title", {"title": 3.0, "tags": 2.0, "type": 1.0, "description": 1.0}),
+    "Certifications": ("certifications", "title", {"title": 3.0, "skills": 2.0, "description": 1.0}),
+    "Experience": ("experiences", "title",
+                   {"title": 3.0, "company": 2.0, "description": 1.0, "responsibilities": 1.0}),
+    "Contact": ("resumes", "title", {"title": 3.0, "description": 1.0}),
+}
+
+_lock = threading.Lock()
+_cache: Dict[str, object] = {"catalogs": None, "index": None, "hits": []}
+
+
+def build_global_index(catalogs: Dict[str, List[Dict]]) -> Tuple[TrigramIndex, List[Tuple[str, str]]]:
+    """Index every record of ``catalogs``; returns the index and ``(section, title)`` per document."""
+    documents, hits = [], []
+    for section, records in catalogs.items():
+        _, title_field, fields = CATALOGS[section]
+        for record in records or []:
+            documents.append([(text, weight) for field, weight in fields.items()
+                              for text in _field_values(record, field)])
+            hits.append((section, str(record.get(title_field, ""))))
+    return TrigramIndex(documents), hits
+
+
+def get_global_index() -> Tuple[TrigramIndex, List[Tuple[str, str]]]:
+    """Return the shared index, rebuilding it when a catalog object changes."""
+    catalogs = {section: get_catalog(name) for section, (name, _, _) in CATALOGS.items()}
+    with _lock:
+        cached = _cache["catalogs"]
+        if cached is not None and all(cached[section] is catalogs[section] for section in catalogs):
+            return _cache["index"], _cache["hits"]
+
+    index, hits = build_global_index(catalogs)
+    logger.info(f"Built global search index: {index.size} record(s), {index.vocabulary_size} word(s)")
+    with _lock:
+        _cache.update(catalogs=catalogs, index=index, hits=hits)
+    return index, hits
+
+
+def search_portfolio(query: str, limit: int = MAX_HITS) -> List[Tuple[str, str, float]]:
+    """Return ``(section, title, score)`` for the best matches of ``query``."""
+    index, hits = get_global_index()
+    return [(*hits[doc_id], score) for doc_id, score in index.search(query, limit=limit)]
+
+
+# Function to jump to the section of a search hit
+def open_section(section: str) -> None:
+    st.session_state.selected = section
+    # A new key resets the navbar so it picks up the new default index
+    st.session_state.navbar_key += 1
+
+
+def render_global_search() -> Optional[str]:
+    """Render the search box and its hits; returns the query."""
+    query = st.text_input(
+        "Search the portfolio",
+        key=SESSION_KEY,
+        placeholder="🔍 Search skills, projects, certifications, experience...",
+        label_visibility="collapsed",
+    ).strip()
+    if not query:
+        return None
+
+    try:
+        results = search_portfolio(query)
+    except Exception as e:
+        logger.error(f"Error searching for {query!r}: {e}")
+        st.error(f"Error searching the portfolio: {str(e)}")
+        return query
+
+    if not results:
+        st.caption(f"No matches for \"{query}\".")
+        return query
+
+    columns = st.columns(min(len(results), 4))
+    for i, (section, title, _) in enumerate(results):
+        with columns[i % len(columns)]:
+            st.button(f"{section} · {title}", key=f"global_search_hit_{i}",
+                      on_click=open_section, args=(section,))
+    return query
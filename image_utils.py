@@ -1,11 +1,10 @@
 # image_utils.py
 import streamlit as st
-from PIL import Image
 import io
 import os
 import hashlib
 import logging
-import base64
+from encoder_cache import encode_file
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -37,7 +36,8 @@ def load_and_optimize_image(image_path, max_width=800, quality=85, format="WEBP"
             with open(cache_path, "rb") as f:
                 return f.read()
         
-        # Load and process the image
+        # Load and process the image (PIL is only needed on a cache miss)
+        from PIL import Image
         img = Image.open(image_path)
         
         # Convert to RGB if needed (for formats like PNG with transparency)
@@ -112,6 +112,8 @@ def display_responsive_image(image_path, mobile_width=300, desktop_width=None, c
 def get_image_base64(image_path: str) -> str:
     """Converts an image file to a base64 string.
 
+    Results come from the shared encoder cache in ``encoder_cache``.
+
     Args:
         image_path: The path to the image file.
 
@@ -119,8 +121,7 @@ def get_image_base64(image_path: str) -> str:
         A base64 encoded string of the image.
     """
     try:
-        with open(image_path, "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode("utf-8")
+        return encode_file(image_path)
     except FileNotFoundError:
         logger.error(f"Image file not found: {image_path}")
         return ""
@@ -3,87 +3,94 @@ import streamlit as st
 from typing import Callable, Dict, Any
 import importlib
 import sys
+import threading
 import logging
 
+from catalog_store import CatalogError
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class LazyComponentLoader:
-    """Lazy loads components to improve initial load time"""
-    
+    """
+    Lazy loads section modules and their components on first use.
+
+    Modules are tracked in ``sys.modules`` and the locks live on the
+    module-level singleton below, so every session in the process shares them.
+    A per-module lock makes sure a module is imported by one thread only, while
+    other sessions wait for it instead of importing it again.
+    """
+
     def __init__(self):
-        self.loaded_components = {}
-        self.loading_states = {}
-    
-    @st.cache_resource
+        self._module_locks: Dict[str, threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+
+    def _module_lock(self, module_name: str) -> threading.Lock:
+        with self._registry_lock:
+            return self._module_locks.setdefault(module_name, threading.Lock())
+
     def _import_module(self, module_name: str):
-        """Import a module and cache it"""
-        try:
-            if module_name in sys.modules:
-                return sys.modules[module_name]
-            logger.info(f"Importing module: {module_name}")
-            return importlib.import_module(module_name)
-        except ImportError as e:
-            logger.error(f"Failed to import {module_name}: {e}")
-            st.error(f"Failed to import {module_name}. Please check the logs for details.")
-            return None
-    
-    def load_component(self, module_name: str, component_name: str) -> Callable:
+        """Import a module once per process (thread-safe)."""
+        with self._module_lock(module_name):
+            if module_name not in sys.modules:
+                logger.info(f"Importing module: {module_name}")
+                with st.spinner(f"Loading {module_name}..."):
+                    return importlib.import_module(module_name)
+        # A module is in sys.modules before its body has run; import_module
+        # waits until the thread importing it has finished
+        return importlib.import_module(module_name)
+
+    def load_component(self, module_name: str, component_name: str) -> Any:
         """
-        Lazy load a component function from a module
-        
+        Lazy load a component function (or any attribute) from a module
+
         Args:
             module_name: Name of the module (e.g., 'certifications')
             component_name: Name of the function to import (e.g., 'render_certifications_section')
-            
+
         Returns:
-            The loaded component function
+            The loaded component, or a placeholder that reports the failure
         """
-        component_key = f"{module_name}.{component_name}"
-        
-        # Return if already loaded
-        if component_key in self.loaded_components:
-            return self.loaded_components[component_key]
-        
-        # Show loading indicator if not already showing
-        if component_key not in self.loading_states:
-            self.loading_states[component_key] = True
-            with st.spinner(f"Loading {component_name}..."):
-                # Import the module
-                module = self._import_module(module_name)
-                if module is None:
-                    return lambda *args, **kwargs: st.error(f"Failed to load {component_name}")
-                
-                # Get the component function
-                if hasattr(module, component_name):
-                    component = getattr(module, component_name)
-                    self.loaded_components[component_key] = component
-                    # Clear loading state
-                    self.loading_states.pop(component_key, None)
-                    return component
-                else:
-                    logger.error(f"Component {component_name} not found in {module_name}")
-                    st.error(f"Component {component_name} not found in {module_name}")
-                    # Clear loading state
-                    self.loading_states.pop(component_key, None)
-                    return lambda *args, **kwargs: st.error(f"Component {component_name} not found")
-        else:
-            # Return placeholder while loading
-            return lambda *args, **kwargs: st.info(f"Loading {component_name}...")
+        # Look the component up on every call (a sys.modules hit once imported)
+        # so modules reloaded by Streamlit's file watcher are picked up
+        try:
+            module = self._import_module(module_name)
+        except ImportError as e:
+            logger.error(f"Failed to import {module_name}: {e}")
+            st.error(f"Failed to import {module_name}. Please check the logs for details.")
+            return lambda *args, **kwargs: st.error(f"Failed to load {component_name}")
+
+        if not hasattr(module, component_name):
+            logger.error(f"Component {component_name} not found in {module_name}")
+            st.error(f"Component {component_name} not found in {module_name}")
+            return lambda *args, **kwargs: st.error(f"Component {component_name} not found")
+
+        return getattr(module, component_name)
 
     def load_data(self, module_name: str, data_name: str) -> Any:
         """
         Lazy load a data object from a module
-        
+
         Args:
             module_name: Name of the module (e.g., 'data')
             data_name: Name of the data object to load (e.g., 'sample_certifications')
-            
+
         Returns:
-            The loaded data object
+            The loaded data object (None if it could not be loaded)
         """
-        return self.load_component(module_name, data_name)
+        try:
+            module = self._import_module(module_name)
+        except ImportError as e:
+            logger.error(f"Failed to import {module_name}: {e}")
+            st.error(f"Failed to import {module_name}. Please check the logs for details.")
+            return None
+        try:
+            return getattr(module, data_name, None)
+        except CatalogError as e:
+            logger.error(f"Failed to load {data_name}: {e}")
+            st.error(f"Failed to load {data_name}. Please check the logs for details.")
+            return None
 
 # Create a singleton instance
 lazy_loader = LazyComponentLoader()
@@ -94,4 +101,4 @@ def load_component(module_name: str, component_name: str) -> Callable:
 
 def load_data(module_name: str, data_name: str) -> Any:
     """Helper function to lazy load data objects"""
-    return lazy_loader.load_data(module_name, data_name)
\ No newline at end of file
+    return lazy_loader.load_data(module_name, data_name)
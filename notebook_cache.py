@@ -0,0 +1,88 @@
+# notebook_cache.py
+"""
+On-disk cache of nbconvert-rendered sample notebooks.
+
+Rendered HTML is stored under ``.streamlit/notebook_cache/``. Each entry is
+keyed by the notebook's content hash, the exporter template and the installed
+nbconvert version. A cache hit only reads a file; nbformat and nbconvert are
+imported the first time a notebook actually has to be converted.
+"""
+import hashlib
+import logging
+import os
+import threading
+from importlib import metadata
+from typing import Dict
+
+from assets import BASE_DIR, content_hash
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(BASE_DIR, ".streamlit", "notebook_cache")
+DEFAULT_TEMPLATE = "lab"
+
+_convert_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _nbconvert_version() -> str:
+    """Return the installed nbconvert version without importing it."""
+    try:
+        return metadata.version("nbconvert")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def get_cache_path(notebook_path: str, template: str = DEFAULT_TEMPLATE) -> str:
+    """Return the cache file path for a notebook rendered with ``template``."""
+    key = f"{content_hash(notebook_path)}:{template}:{_nbconvert_version()}"
+    digest = hashlib.sha256(key.encode()).hexdigest()[:24]
+    return os.path.join(CACHE_DIR, f"{digest}.html")
+
+
+def render_notebook_html(notebook_path: str, template: str = DEFAULT_TEMPLATE) -> str:
+    """
+    Return a notebook rendered to standalone HTML, converting it only on a cache miss.
+
+    Args:
+        notebook_path: Path to the ``.ipynb`` file
+        template: nbconvert HTML template name
+
+    Returns:
+        The rendered HTML document
+
+    Raises:
+        OSError: If the notebook cannot be read
+        Exception: Any conversion error raised by nbformat/nbconvert
+    """
+    cache_path = get_cache_path(notebook_path, template)
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+
+    with _locks_guard:
+        lock = _convert_locks.setdefault(cache_path, threading.Lock())
+    with lock:
+        # Another session may have converted it while we waited
+        if os.path.exists(cache_path):
+            with open(cache_path, encoding="utf-8") as f:
+                return f.read()
+
+        from nbformat import read as read_notebook
+        from nbconvert import HTMLExporter
+
+        notebook_content = read_notebook(notebook_path, as_version=4)
+        html_exporter = HTMLExporter(template_name=template)
+        (body, _) = html_exporter.from_notebook_node(notebook_content)
+
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(body)
+        os.replace(tmp_path, cache_path)
+        logger.info(f"Rendered notebook {notebook_path} to {cache_path}")
+        return body
@@ -0,0 +1,115 @@
+# page_assets.py
+"""
+Sends each inline image once per page, even when the page shows it several times.
+
+With static serving, identical files already share one fingerprinted URL, so
+the browser downloads them once. Without it, images are inlined as base64 data
+URIs, and every repeat carries the whole payload again. For example, one PDF
+thumbnail appears three times on the Certifications page, and the profile
+picture and a gallery image resolve to the same variant.
+
+``dedupe_images`` hashes the data URIs in a block of HTML. The first time an
+image appears during a script run, a CSS rule keyed by its hash is emitted that
+carries the image as a background. Every ``<img>`` showing that image,
+including the first, then gets a placeholder ``src`` of a few dozen bytes. The
+placeholder is an empty SVG with the image's aspect ratio, so the layout
+matches the original.
+
+The list of images already sent is reset by ``start()`` at the top of every
+full run. During a fragment rerun only the fragment's elements are replaced,
+and a rule emitted outside it may no longer be on the page, so no rules are
+emitted then. Pass ``fragment=True`` for HTML rendered inside ``st.fragment``
+functions for the same reason.
+
+Images the browser already holds in its IndexedDB cache (see
+``asset_cache``) are replaced with placeholders in every case. The browser
+fills them in, so they are not sent again when a visitor comes back to a
+section.
+"""
+import base64
+import binascii
+import hashlib
+import logging
+import re
+import threading
+from io import BytesIO
+from typing import Dict, Optional, Tuple
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from asset_cache import held_assets
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_DATA_URI_RE = re.compile(r"""src=(["'])(data:image/[a-z0-9.+-]+;base64,([A-Za-z0-9+/=]+))\1""")
+_PLACEHOLDER = "data:image/svg+xml,%3Csvg%20xmlns=%22http://www.w3.org/2000/svg%22%20viewBox=%220%200%20{w}%20{h}%22/%3E"
+
+_local = threading.local()
+_size_lock = threading.Lock()
+# content hash -> (width, height), or None if the image could not be decoded
+_sizes: Dict[str, Optional[Tuple[int, int]]] = {}
+
+
+def start() -> None:
+    """Forget the images sent so far; called at the start of every full script run."""
+    _local.sent = set()
+
+
+def _image_size(digest: str, payload: str) -> Optional[Tuple[int, int]]:
+    with _size_lock:
+        if digest in _sizes:
+            return _sizes[digest]
+    try:
+        from PIL import Image
+
+        with Image.open(BytesIO(base64.b64decode(payload))) as image:
+            size = image.size
+    except (binascii.Error, OSError, ValueError) as e:
+        logger.debug(f"Not deduplicating inline image {digest}: {e}")
+        size = None
+    with _size_lock:
+        _sizes[digest] = size
+    return size
+
+
+def dedupe_images(html: str, fragment: bool = False) -> str:
+    """Replace inline images already sent during this run, or held by the browser, with references to them."""
+    if "data:image/" not in html:
+        return html
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return html
+    held = held_assets()
+    sent = None if fragment or ctx.fragment_ids_this_run else getattr(_local, "sent", None)
+    if sent is None and held is None:
+        return html
+
+    rules = []
+
+    def replace(match: re.Match) -> str:
+        quote, uri, payload = match.groups()
+        digest = hashlib.sha256(payload.encode("ascii")).hexdigest()[:16]
+        size = _image_size(digest, payload)
+        if size is None:
+            return match.group(0)
+        reference = f"src={quote}{_PLACEHOLDER.format(w=size[0], h=size[1])}{quote} data-asset={quote}{digest}{quote}"
+        if held is not None:
+            if digest in held:
+                # Filled in by the browser from its cache
+                return reference
+            # The browser caches it as soon as it is rendered
+            held.add(digest)
+        if sent is None:
+            return f"{match.group(0)} data-asset={quote}{digest}{quote}"
+        if digest not in sent:
+            sent.add(digest)
+            rules.append(f'img[data-asset="{digest}"] {{ background-image: url("{uri}"); '
+                         "background-size: cover; background-position: center; background-repeat: no-repeat; }")
+        return reference
+
+    html = _DATA_URI_RE.sub(replace, html)
+    if rules:
+        html = f"<style>{' '.join(rules)}</style>{html}"
+    return html
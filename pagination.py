@@ -0,0 +1,36 @@
+# pagination.py
+"""
+"Load more" paging for the card grids.
+
+Each grid stores how many of its cards are visible in ``st.session_state``.
+The count goes back to one page when the grid's search, filters or sort
+change. Renderers ask their catalog for that many records only, so the cards
+(and the files they read) past the visible window are never built. The cost
+of a rerun therefore depends on the page size, not on the size of the catalog.
+"""
+from typing import Any
+
+import streamlit as st
+
+
+def visible_count(key: str, page_size: int, filters: Any = None) -> int:
+    """Return how many cards grid ``key`` shows, starting over when ``filters`` change."""
+    count_key, filters_key = f"{key}_visible", f"{key}_filters"
+    if count_key not in st.session_state or st.session_state.get(filters_key) != filters:
+        st.session_state[filters_key] = filters
+        st.session_state[count_key] = page_size
+    return st.session_state[count_key]
+
+
+# Function to reveal the next page of a grid
+def load_more(key: str, page_size: int) -> None:
+    st.session_state[f"{key}_visible"] += page_size
+
+
+def render_load_more(key: str, shown: int, total: int, page_size: int) -> None:
+    """Show how many cards are visible and a "Load more" button while some remain."""
+    if shown >= total:
+        return
+    st.caption(f"Showing {shown} of {total}")
+    st.button(f"Load more ({min(page_size, total - shown)} more)", key=f"{key}_load_more",
+              on_click=load_more, args=(key, page_size))
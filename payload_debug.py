@@ -0,0 +1,173 @@
+# payload_debug.py
+"""
+Opt-in payload instrumentation, turned on with ``?debug=payload``.
+
+While a section renders, calls to ``st.markdown``, ``st.components.v1.html``,
+``st.dataframe`` and ``st.download_button`` are counted and sized. Each call is
+attributed to the section and to the function that made it. A sidebar panel
+then ranks them by bytes, so the heaviest part of a page is easy to spot.
+
+The wrappers are installed once per process and only record on threads with
+an active recorder. Sessions without the query parameter pay one
+thread-local lookup per call.
+"""
+import logging
+import sys
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Tuple
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+QUERY_PARAM = "debug"
+QUERY_VALUE = "payload"
+
+_local = threading.local()
+_install_lock = threading.Lock()
+
+
+def payload_debug_enabled() -> bool:
+    """Return True when the page was opened with ``?debug=payload``."""
+    try:
+        return st.query_params.get(QUERY_PARAM) == QUERY_VALUE
+    except Exception:
+        return False
+
+
+def _payload_size(value: Any) -> int:
+    """Best-effort size in bytes of what a call sends to the browser."""
+    if value is None or callable(value):
+        # Deferred download data is read only when the visitor clicks
+        return 0
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if hasattr(value, "memory_usage"):
+        # pandas DataFrame; Arrow serialization is close to its in-memory size
+        try:
+            return int(value.memory_usage(index=True, deep=True).sum())
+        except Exception:
+            pass
+    if hasattr(value, "read"):
+        return 0
+    return len(str(value).encode("utf-8"))
+
+
+class PayloadRecorder:
+    """Collects (section, function, kind) -> [elements, bytes] for one rerun."""
+
+    def __init__(self):
+        self.sections = ["app"]
+        self.records: Dict[Tuple[str, str, str], list] = defaultdict(lambda: [0, 0])
+
+    def record(self, kind: str, caller: str, size: int) -> None:
+        entry = self.records[(self.sections[-1], caller, kind)]
+        entry[0] += 1
+        entry[1] += size
+
+    def totals_by_section(self) -> Dict[str, list]:
+        totals: Dict[str, list] = defaultdict(lambda: [0, 0])
+        for (section, _, _), (count, size) in self.records.items():
+            totals[section][0] += count
+            totals[section][1] += size
+        return totals
+
+
+def _wrap(kind: str, func, payload_arg: str):
+    """Wrap a Streamlit call so the active recorder sees its payload."""
+    def wrapper(*args, **kwargs):
+        recorder = getattr(_local, "recorder", None)
+        if recorder is not None:
+            payload = args[0] if args else kwargs.get(payload_arg)
+            if kind == "download_button":
+                payload = args[1] if len(args) > 1 else kwargs.get("data")
+            frame = sys._getframe(1)
+            caller = f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_name}"
+            recorder.record(kind, caller, _payload_size(payload))
+        return func(*args, **kwargs)
+
+    wrapper.__wrapped__ = func
+    wrapper._payload_local = _local
+    return wrapper
+
+
+def _unwrapped(func):
+    while getattr(func, "_payload_local", None) is not None:
+        func = func.__wrapped__
+    return func
+
+
+def install() -> None:
+    """Wrap the instrumented Streamlit calls (idempotent, process-wide)."""
+    with _install_lock:
+        if getattr(st.markdown, "_payload_local", None) is _local:
+            return
+        # Re-wrap the originals if this module was reloaded by the file watcher
+        st.markdown = _wrap("markdown", _unwrapped(st.markdown), "body")
+        st.dataframe = _wrap("dataframe", _unwrapped(st.dataframe), "data")
+        st.download_button = _wrap("download_button", _unwrapped(st.download_button), "data")
+        components.html = _wrap("components.html", _unwrapped(components.html), "html")
+        logger.info("Payload instrumentation installed")
+
+
+def start() -> None:
+    """Begin recording this rerun when ``?debug=payload`` is set."""
+    if payload_debug_enabled():
+        install()
+        _local.recorder = PayloadRecorder()
+    else:
+        _local.recorder = None
+
+
+@contextmanager
+def track(section: str):
+    """Attribute everything emitted inside the block to ``section``."""
+    recorder = getattr(_local, "recorder", None)
+    if recorder is None:
+        yield
+        return
+    recorder.sections.append(section)
+    try:
+        yield
+    finally:
+        recorder.sections.pop()
+
+
+def _format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size:,} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:,.1f} KB"
+    return f"{size / (1024 * 1024):,.1f} MB"
+
+
+def render_panel(limit: int = 25) -> None:
+    """Stop recording and show the sidebar panel ranked by bytes."""
+    recorder = getattr(_local, "recorder", None)
+    _local.recorder = None
+    if recorder is None:
+        return
+
+    totals = recorder.totals_by_section()
+    grand_total = sum(size for _, size in totals.values())
+    with st.sidebar:
+        st.markdown("### Payload debug")
+        st.caption(f"{_format_bytes(grand_total)} in {sum(c for c, _ in totals.values())} instrumented elements this rerun")
+
+        lines = ["| Section | Elements | Bytes |", "|---|---:|---:|"]
+        for section, (count, size) in sorted(totals.items(), key=lambda item: item[1][1], reverse=True):
+            lines.append(f"| {section} | {count} | {_format_bytes(size)} |")
+        st.markdown("\n".join(lines))
+
+        lines = ["| Section | Function | Call | Elements | Bytes |", "|---|---|---|---:|---:|"]
+        ranked = sorted(recorder.records.items(), key=lambda item: item[1][1], reverse=True)
+        for (section, caller, kind), (count, size) in ranked[:limit]:
+            lines.append(f"| {section} | `{caller}` | {kind} | {count} | {_format_bytes(size)} |")
+        st.markdown("\n".join(lines))
@@ -1,73 +1,36 @@
 import streamlit as st
 import os
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from datetime import datetime
-import base64
-from io import BytesIO
 from utils import animate_text_letter_by_letter
+from downloads import download_link_html, render_download_button
+from style_registry import inject_styles
+from fragment_cache import cached_fragment
+from catalog_store import catalog_attributes
+from pagination import render_load_more, visible_count
+from search_index import open_catalog
+
 
 # Function to load custom CSS styles
 def load_styles():
-    """Load custom CSS styles for the projects section."""
-    st.markdown("""
-    <style>
-    /* Project Card Styling */
-    .project-card {
-        background-color: var(--royal-secondary-bg); /* Use royal secondary background */
-        border-radius: 10px;
-        padding: 1.5rem;
-        margin-bottom: 20px;
-        box-shadow: 0 4px 6px var(--royal-shadow); /* Use royal shadow */
-        color: var(--royal-light-text); /* Default text color for card content */
-    }
-    .project-card h3 {
-        color: var(--royal-accent); /* Headings in gold */
-    }
-    .project-card p b {
-        color: var(--royal-accent); /* Bold text in gold */
-    }
-
-    /* Project Resources Section */
-    .project-resources {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 10px;
-        margin-top: 1rem;
-    }
-
-    /* File Download Button Styling (using global .btn) */
-    
-    /* Search and Filter Controls */
-    .stTextInput > div > div > input, .stMultiSelect > div > div {
-        background-color: var(--royal-dark) !important;
-        color: var(--royal-light-text) !important;
-        border: 1px solid var(--royal-accent) !important;
-        border-radius: 5px !important;
-        box-shadow: inset 0 0 5px rgba(255, 215, 0, 0.2) !important;
-    }
-    .stTextInput > div > div > input:focus, .stMultiSelect > div > div:focus-within {
-        border-color: var(--royal-accent) !important;
-        box-shadow: 0 0 10px var(--royal-accent), inset 0 0 8px rgba(255, 215, 0, 0.5) !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    """Add the shared stylesheet (including the projects styles) to the page."""
+    inject_styles()
 
-# Function to create a download link for files
-def get_file_download_link(file_path: str, label: str):
-    """Create a download link for a file."""
-    try:
-        with open(file_path, "rb") as file:
-            file_bytes = file.read()
-        b64 = base64.b64encode(file_bytes).decode()
-        href = f'<a href="data:application/octet-stream;base64,{b64}" download="{os.path.basename(file_path)}" class="btn">{label}</a>'
-        return href
-    except Exception as e:
-        st.error(f"Error generating download link: {e}")
-        return ""
+# Searchable fields and their relevance weights
+PROJECT_SEARCH_FIELDS = {"title": 3.0, "categories": 2.0, "tags": 2.0, "skills": 2.0, "description": 1.0}
 
-# Function to render an individual project card
-def render_project_card(project: Dict[str, str]):
-    """Render an individual project card."""
+# Project cards per "Load more" page
+PROJECT_PAGE_SIZE = 5
+
+# Function to build the HTML of a project card (cached across sessions)
+def build_project_card(project: Dict[str, str]) -> Tuple[str, List[Tuple[str, str]], List[str]]:
+    """
+    Build a project card.
+
+    Returns:
+        The card HTML, the (file, label) downloads to render as buttons after
+        the card, and any error messages to show
+    """
     # Start building the HTML for the project card
     card_html = f"""
     <div class='project-card card'>
@@ -89,15 +52,32 @@ def render_project_card(project: Dict[str, str]):
     card_html += "<h4>Project Resources</h4>"
     card_html += "<div class='project-resources'>" # Use flexbox for layout
 
+    # Downloads that could not be linked by URL are rendered as buttons after the card
+    deferred_downloads = []
+    errors = []
+
+    def download_link(file_path: str, label: str) -> str:
+        try:
+            return download_link_html(file_path, label) or ""
+        except OSError as e:
+            errors.append(f"Error generating download link: {e}")
+            return ""
+
     # Code file download
     if 'code_file' in project and os.path.exists(project['code_file']):
-        card_html += get_file_download_link(project['code_file'], "Download Code")
+        link_html = download_link(project['code_file'], "Download Code")
+        card_html += link_html
+        if not link_html:
+            deferred_downloads.append((project['code_file'], "Download Code"))
     else:
         card_html += "<span style='color: var(--royal-light-text); font-size: 0.9em;'>No code file available.</span>"
 
     # PowerPoint presentation download
     if 'ppt_file' in project and os.path.exists(project['ppt_file']):
-        card_html += get_file_download_link(project['ppt_file'], "Download PPT")
+        link_html = download_link(project['ppt_file'], "Download PPT")
+        card_html += link_html
+        if not link_html:
+            deferred_downloads.append((project['ppt_file'], "Download PPT"))
     else:
         card_html += "<span style='color: var(--royal-light-text); font-size: 0.9em;'>No PowerPoint presentation available.</span>"
 
@@ -111,21 +91,35 @@ def render_project_card(project: Dict[str, str]):
         """
     elif 'video_file' in project and os.path.exists(project['video_file']):
         # Provide download link for local video files
-        card_html += get_file_download_link(project['video_file'], "Download Video")
+        link_html = download_link(project['video_file'], "Download Video")
+        card_html += link_html
+        if not link_html:
+            deferred_downloads.append((project['video_file'], "Download Video"))
     else:
         card_html += "<span style='color: var(--royal-light-text); font-size: 0.9em;'>No video presentation available.</span>"
 
     card_html += "</div>" # Close project resources div
     card_html += "</div>" # Close project-card div
+    return card_html, deferred_downloads, errors
 
+# Function to render an individual project card
+def render_project_card(project: Dict[str, str]):
+    """Render an individual project card."""
+    files = [project.get('code_file'), project.get('ppt_file'), project.get('video_file')]
+    card_html, deferred_downloads, errors = cached_fragment("project_card", project, build_project_card, files=files)
+    for error in errors:
+        st.error(error)
     st.markdown(card_html, unsafe_allow_html=True)
 
+    for file_path, label in deferred_downloads:
+        render_download_button(file_path, label, key=f"project_download_{project['title']}_{file_path}")
+
 # Main function to render the projects section
 def render_projects_section(projects: List[Dict[str, str]]):
     """Render the projects section."""
     st.markdown(f"""
     <div id='projects' class='section fade-in'>
-        <h2 style='text-align: center;'>{animate_text_letter_by_letter("My Projects", tag='span', delay_per_letter=0.10, animation_duration=3.5)}</h2>
+        <h2 style='text-align: center;'>{animate_text_letter_by_letter("My Projects", tag='span', delay_per_letter=0.10, animation_duration=3.5, infinite=False)}</h2>
         <div class="royal-header-particles">
             <span>🚀</span><span>💡</span><span>🎯</span><span>✅</span><span>🌟</span><span>🏗️</span><span>💻</span><span>📈</span><span>✨</span>
         </div>
@@ -136,12 +130,16 @@ def render_projects_section(projects: List[Dict[str, str]]):
     # Load custom styles
     load_styles()
     
-    # Extract all unique categories for filtering
-    all_categories = []
-    for project in projects:
-        if 'categories' in project:
-            all_categories.extend(project['categories'])
-    all_categories = sorted(list(set(all_categories)))
+    # Filters and results rerun on their own, so a keystroke re-sends only the result list
+    render_projects_results(projects)
+
+# Search and filter controls plus the matching project cards
+@st.fragment
+def render_projects_results(projects: List[Dict[str, str]]) -> None:
+    """Render the project filters and results as one partial-rerun unit."""
+    # Searchable catalog (in-memory index or SQLite) and all unique categories for filtering
+    catalog = open_catalog("projects", projects, PROJECT_SEARCH_FIELDS, facets=("categories",))
+    all_categories = catalog.facet_values("categories")
     
     # Filters and search section
     st.markdown(" ", unsafe_allow_html=True)
@@ -152,62 +150,24 @@ def render_projects_section(projects: List[Dict[str, str]]):
     # Filter options
     selected_categories = st.multiselect("Filter by Category", options=all_categories, help="Select one or more categories")
     
-    # Apply filters and search
-    filtered_projects = projects.copy()
-    
-    # Filter by search query
-    if search_query:
-        filtered_projects = [
-            project for project in filtered_projects if 
-            search_query.lower() in project['title'].lower() or
-            ('categories' in project and any(search_query.lower() in category.lower() for category in project['categories'])) or
-            ('skills' in project and any(search_query.lower() in skill.lower() for skill in project['skills']))
-        ]
-    
-    # Filter by categories
-    if selected_categories:
-        filtered_projects = [
-            project for project in filtered_projects if 
-            'categories' in project and any(category in selected_categories for category in project['categories'])
-        ]
+    # Apply search and category filters (matches ranked by relevance), fetching only the visible pages
+    visible = visible_count("projects_list", PROJECT_PAGE_SIZE, (search_query, tuple(selected_categories)))
+    filtered_projects, total = catalog.query(search_query, filters={"categories": selected_categories}, limit=visible)
     
     # Display filtered projects
     if not filtered_projects:
         st.info("No projects match your search criteria. Try adjusting your filters.")
     else:
-        st.write(f"Displaying {len(filtered_projects)} project(s)")
+        st.write(f"Displaying {total} project(s)")
         
         for project in filtered_projects:
             render_project_card(project)
             st.markdown("---")
 
-# Sample project data structure
-sample_projects = [
-    {
-        "title": "Oil-Price Prediction",
-        "description": "Developed an oil price prediction app for strategic decision-making and increased profitability. Mined over 35 years of oil price data using Python and yfinance, resulting in more than 11,000 values. The app maintains a variance range of 1.2% to 2% in oil price predictions, aiding strategic planning in the oil industry.",
-        "duration": "March, 2023 - June, 2023",
-        "type": "AI Variant Internship Project",
-        "icon": "https://cdn-icons-png.flaticon.com/512/667/667984.png",
-        "tags": ["Python", "AI", "Data Science"]
-    },
-    {
-        "title": "Real/Fake News Detection",
-        "description": "Developed a user-friendly web app leveraging advanced Natural Language Processing (NLP) techniques. Analyzed and extracted sentiment from a dataset exceeding 80,000 articles. The app offers near-instantaneous verification of news authenticity, delivering reliable results within milliseconds.",
-        "duration": "July, 2023 - October, 2023",
-        "type": "AI Variant Internship Project",
-        "icon": "https://cdn-icons-png.flaticon.com/512/1697/1697488.png",
-        "tags": ["NLP", "Machine Learning", "Web Development"]
-    },
-    {
-        "title": "Rating Prediction of Google Play Store Apps",
-        "description": "Analyzed a dataset of over 100,000 app entries using Python and sklearn, experimenting with various regression algorithms and optimizing model parameters. The result was a predictive model that achieved an impressive 93% accuracy. This model has since been instrumental in helping app developers identify trending categories and improve their app development strategies.",
-        "duration": "Feb, 2022 - Jun, 2022",
-        "type": "Final Semester Project",
-        "icon": "https://cdn-icons-png.flaticon.com/512/816/816964.png",
-        "tags": ["Data Analysis", "Regression", "Python"]
-    }
-]
+        render_load_more("projects_list", len(filtered_projects), total, PROJECT_PAGE_SIZE)
+
+# Projects live in data/catalog/projects.json; ``sample_projects`` reads the current version
+__getattr__ = catalog_attributes(__name__, {"sample_projects": "projects"})
 
 # Export the sample_projects variable
 __all__ = ['render_projects_section', 'sample_projects']
\ No newline at end of file
@@ -0,0 +1,276 @@
+# search_index.py
+"""
+In-memory inverted index for the skills and projects catalogs.
+
+Each record's text fields are tokenized once into a term -> {record: weight}
+map. Sorted terms allow prefix lookups with ``bisect``, so "pyth" finds
+"python". A query ANDs its tokens and ranks the matches by the summed field
+weights, with exact terms ranking above prefix matches. Sort orders and
+exact-value facets (e.g. category filters) are also precomputed. Search cost
+depends on the matching postings, not on catalog size times field count.
+
+``TrigramIndex`` is the typo-tolerant variant used by the global search box.
+
+Section renderers go through ``open_catalog``. It returns an ``IndexedCatalog``
+(records plus their index), or the SQLite-backed equivalent from
+``catalog_sqlite`` when ``PORTFOLIO_CATALOG_BACKEND=sqlite``.
+
+Indexes are built once per catalog object and shared across sessions.
+"""
+import bisect
+import logging
+import os
+import re
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[0-9a-z]+")
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+
+# Prefix matches score less than whole-term matches
+PREFIX_MATCH_FACTOR = 0.6
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase ``text`` and split it into alphanumeric tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def version_year(version: Optional[str]) -> int:
+    """Return the first four-digit year in a version string ("Power BI 2021" -> 2021), or 0."""
+    match = _YEAR_RE.search(version or "")
+    return int(match.group(0)) if match else 0
+
+
+def _field_values(record: Mapping, field: str) -> List[str]:
+    value = record.get(field)
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return [str(item) for item in value]
+
+
+class SearchIndex:
+    """Token index over ``fields`` of ``records`` with precomputed sort orders and facets."""
+
+    def __init__(self, records: Sequence[Mapping], fields: Mapping[str, float],
+                 sort_keys: Optional[Mapping[str, Callable[[Mapping], Any]]] = None,
+                 facets: Iterable[str] = ()):
+        self.size = len(records)
+        postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        for record_id, record in enumerate(records):
+            for field, weight in fields.items():
+                for value in _field_values(record, field):
+                    for token in set(tokenize(value)):
+                        # A term found in several fields counts with its best field
+                        postings[token][record_id] = max(postings[token].get(record_id, 0.0), weight)
+        self._postings = dict(postings)
+        self._terms = sorted(self._postings)
+
+        # Position of every record in each sort order, so results sort in O(k log k)
+        self._ranks: Dict[str, List[int]] = {}
+        for name, key in (sort_keys or {}).items():
+            order = sorted(range(self.size), key=lambda i: key(records[i]))
+            ranks = [0] * self.size
+            for position, record_id in enumerate(order):
+                ranks[record_id] = position
+            self._ranks[name] = ranks
+
+        self._facets: Dict[str, Dict[str, Set[int]]] = {}
+        for field in facets:
+            values: Dict[str, Set[int]] = defaultdict(set)
+            for record_id, record in enumerate(records):
+                for value in _field_values(record, field):
+                    values[value].add(record_id)
+            self._facets[field] = dict(values)
+
+    def _prefix_terms(self, prefix: str) -> List[str]:
+        start = bisect.bisect_left(self._terms, prefix)
+        end = bisect.bisect_left(self._terms, prefix + "\uffff", lo=start)
+        return self._terms[start:end]
+
+    def _token_scores(self, token: str) -> Dict[int, float]:
+        """Best score per record for one query token (exact or prefix match)."""
+        scores: Dict[int, float] = {}
+        for term in self._prefix_terms(token):
+            factor = 1.0 if term == token else PREFIX_MATCH_FACTOR
+            for record_id, weight in self._postings[term].items():
+                score = weight * factor
+                if score > scores.get(record_id, 0.0):
+                    scores[record_id] = score
+        return scores
+
+    def search(self, query: str) -> List[int]:
+        """Return ids of records matching every token of ``query``, best match first."""
+        tokens = tokenize(query)
+        if not tokens:
+            return list(range(self.size))
+
+        per_token = sorted((self._token_scores(token) for token in set(tokens)), key=len)
+        if not per_token[0]:
+            return []
+        # Intersect starting from the rarest token
+        totals = dict(per_token[0])
+        for scores in per_token[1:]:
+            totals = {record_id: total + scores[record_id] for record_id, total in totals.items() if record_id in scores}
+            if not totals:
+                return []
+        return sorted(totals, key=lambda record_id: (-totals[record_id], record_id))
+
+    def facet_ids(self, field: str, values: Iterable[str]) -> Set[int]:
+        """Return ids of records whose ``field`` contains any of ``values``."""
+        facet = self._facets.get(field, {})
+        matched: Set[int] = set()
+        for value in values:
+            matched |= facet.get(value, set())
+        return matched
+
+    def facet_values(self, field: str) -> List[str]:
+        """Return the distinct values of a facet field, sorted."""
+        return sorted(self._facets.get(field, {}))
+
+    def sort_ids(self, record_ids: Iterable[int], key: str, reverse: bool = False) -> List[int]:
+        """Sort ids by a precomputed order."""
+        ranks = self._ranks[key]
+        return sorted(record_ids, key=ranks.__getitem__, reverse=reverse)
+
+
+def trigrams(word: str) -> Set[str]:
+    """Return the padded character trigrams of a word ("ai" -> {"  a", " ai", "ai "})."""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Typo-tolerant word index: query words match catalog words whose trigram
+    sets are similar (Dice coefficient), so "pyhton" still finds "python".
+
+    Each document is a list of ``(text, weight)`` pairs.
+    """
+
+    def __init__(self, documents: Sequence[Sequence[Tuple[str, float]]], threshold: float = 0.4):
+        self.size = len(documents)
+        self.threshold = threshold
+        word_ids: Dict[str, int] = {}
+        self._word_docs: List[Dict[int, float]] = []
+        for doc_id, fields in enumerate(documents):
+            for text, weight in fields:
+                for word in set(tokenize(text)):
+                    word_id = word_ids.setdefault(word, len(word_ids))
+                    if word_id == len(self._word_docs):
+                        self._word_docs.append({})
+                    docs = self._word_docs[word_id]
+                    docs[doc_id] = max(docs.get(doc_id, 0.0), weight)
+
+        self._word_sizes: List[int] = [0] * len(word_ids)
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for word, word_id in word_ids.items():
+            grams = trigrams(word)
+            self._word_sizes[word_id] = len(grams)
+            for gram in grams:
+                postings[gram].append(word_id)
+        self._postings = dict(postings)
+        self.vocabulary_size = len(word_ids)
+
+    def _word_scores(self, token: str) -> Dict[int, float]:
+        """Best score per document for one query word."""
+        grams = trigrams(token)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for word_id in self._postings.get(gram, ()):
+                shared[word_id] += 1
+
+        scores: Dict[int, float] = {}
+        for word_id, count in shared.items():
+            similarity = 2 * count / (len(grams) + self._word_sizes[word_id])
+            if similarity < self.threshold:
+                continue
+            for doc_id, weight in self._word_docs[word_id].items():
+                score = similarity * weight
+                if score > scores.get(doc_id, 0.0):
+                    scores[doc_id] = score
+        return scores
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[int, float]]:
+        """Return up to ``limit`` ``(doc_id, score)`` pairs matching every query word, best first."""
+        tokens = set(tokenize(query))
+        if not tokens:
+            return []
+        per_token = sorted((self._word_scores(token) for token in tokens), key=len)
+        totals = dict(per_token[0])
+        for scores in per_token[1:]:
+            totals = {doc_id: total + scores[doc_id] for doc_id, total in totals.items() if doc_id in scores}
+        return sorted(totals.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+
+_lock = threading.Lock()
+_indexes: Dict[str, Tuple[Sequence[Mapping], SearchIndex]] = {}
+
+
+def get_search_index(name: str, records: Sequence[Mapping], fields: Mapping[str, float],
+                     sort_keys: Optional[Mapping[str, Callable[[Mapping], Any]]] = None,
+                     facets: Iterable[str] = ()) -> SearchIndex:
+    """Return the shared index for ``records``, building it when the catalog object changes."""
+    with _lock:
+        cached = _indexes.get(name)
+        if cached is not None and cached[0] is records:
+            return cached[1]
+
+    index = SearchIndex(records, fields, sort_keys=sort_keys, facets=facets)
+    logger.info(f"Built search index {name!r}: {index.size} record(s), {len(index._terms)} term(s)")
+    with _lock:
+        _indexes[name] = (records, index)
+    return index
+
+
+class IndexedCatalog:
+    """Records plus their ``SearchIndex``, queried like ``catalog_sqlite.SqliteCatalog``."""
+
+    def __init__(self, records: Sequence[Mapping], index: SearchIndex):
+        self.records = records
+        self.index = index
+
+    def facet_values(self, field: str) -> List[str]:
+        """Return the distinct values of a facet field, sorted."""
+        return self.index.facet_values(field)
+
+    def query(self, query: str = "", filters: Optional[Mapping[str, Sequence[str]]] = None,
+              sort: Optional[str] = None, offset: int = 0, limit: Optional[int] = None) -> Tuple[List[Mapping], int]:
+        """
+        Search, filter, sort and page the catalog.
+
+        Matches stay in relevance order unless ``sort`` names a precomputed order.
+
+        Returns:
+            (records on the requested page, total number of matches)
+        """
+        record_ids = self.index.search(query)
+        for field, values in (filters or {}).items():
+            if values:
+                allowed = self.index.facet_ids(field, values)
+                record_ids = [record_id for record_id in record_ids if record_id in allowed]
+        if sort is not None:
+            record_ids = self.index.sort_ids(record_ids, sort)
+
+        end = None if limit is None else offset + limit
+        return [self.records[record_id] for record_id in record_ids[offset:end]], len(record_ids)
+
+
+def open_catalog(name: str, records: Sequence[Mapping], fields: Mapping[str, float],
+                 sort_keys: Optional[Mapping[str, Callable[[Mapping], Any]]] = None,
+                 facets: Iterable[str] = ()):
+    """Return a queryable catalog from the configured backend (in-memory index by default)."""
+    if os.environ.get("PORTFOLIO_CATALOG_BACKEND", "").lower() == "sqlite":
+        try:
+            from catalog_sqlite import get_sqlite_catalog
+            return get_sqlite_catalog(name, records, fields, sort_keys=sort_keys, facets=facets)
+        except Exception as e:
+            logger.error(f"SQLite catalog backend unavailable for {name!r}, using the in-memory index: {e}")
+    return IndexedCatalog(records, get_search_index(name, records, fields, sort_keys=sort_keys, facets=facets))
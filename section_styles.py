@@ -0,0 +1,593 @@
+# section_styles.py
+"""
+The CSS of the app and of every section, kept apart from their code.
+
+``style_registry`` registers all of it when it is imported, so the compiled
+stylesheet does not depend on which sections a process has imported so far.
+That gives one bundle, and one hash, per deploy, and the stylesheet really is
+sent once per session. This module holds only strings, so loading it imports
+no section modules or the libraries they use.
+"""
+import os
+
+BASE_STYLESHEET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles.css")
+
+# App-level CSS (app.py)
+APP_CSS = """
+/* Force background color to eliminate white corners and ensure theme consistency */
+body, [data-testid="stAppViewContainer"], [data-testid="stHeader"] {
+    background-color: #000033 !important;
+}
+
+/* Social Media Links with Hover Effects */
+.social-links a {
+    margin-right: 10px;
+    font-size: 20px;
+    color: var(--royal-accent); /* Use royal accent color */
+    text-decoration: none;
+    transition: transform 0.3s ease, color 0.3s ease;
+}
+.social-links a:hover {
+    transform: scale(1.2);
+    color: var(--royal-light-text); /* Lighter color on hover */
+}
+"""
+
+# Letter-reveal animation (utils.animate_text_letter_by_letter)
+# Letters are staggered by nth-child rules in the shared stylesheet instead of
+# per-letter inline styles; only letters past LETTER_REVEAL_MAX_STAGGER carry --i
+LETTER_REVEAL_MAX_STAGGER = 64
+LETTER_REVEAL_CSS = """
+.letter-reveal > * {
+    display: inline-block;
+    animation-name: letterReveal;
+    animation-duration: var(--letter-duration, 0.5s);
+    animation-timing-function: ease-out;
+    animation-delay: calc(var(--i, 0) * var(--letter-delay, 0.05s));
+    animation-iteration-count: var(--letter-iterations, infinite);
+    animation-fill-mode: var(--letter-fill, none);
+}
+""" + "".join(
+    f".letter-reveal > :nth-child({n + 1}) {{ --i: {n}; }}\n" for n in range(1, LETTER_REVEAL_MAX_STAGGER)
+)
+
+# Custom CSS for the profile section
+PROFILE_CSS = """
+@import url('https://fonts.googleapis.com/css2?family=Playfair+Display:wght@700&family=Roboto:wght@300;400;700&display=swap');
+
+/* The bundle is shared by every page, so page-wide rules are scoped to the page's section */
+:root:has(#profile) body {
+    font-family: 'Roboto', sans-serif;
+    color: var(--royal-light-text);
+}
+
+:root:has(#profile) :is(h1, h2, h3, h4, h5, h6) {
+    font-family: 'Playfair Display', serif;
+    color: var(--royal-accent);
+}
+
+/* The profile page keeps its softer shadows (styles.css sets 0.6 for the other pages) */
+:root:has(#profile) {
+    --royal-shadow: rgba(0, 0, 0, 0.5);
+}
+
+/* Section Styling */
+.royal-section {
+    background-color: var(--royal-dark);
+    padding: 0.75rem 2rem; /* Minimized vertical padding to just contain text */
+    border-radius: 15px;
+    margin-bottom: 2rem;
+    box-shadow: 0 8px 15px var(--royal-shadow); /* Softer shadow */
+    animation: fadeIn 1s ease-out;
+    max-width: 900px; /* Increased breadth */
+    margin-left: auto;
+    margin-right: auto;
+}
+
+/* Header Styling */
+.royal-header {
+    text-align: center;
+    margin-bottom: 2rem;
+    position: relative; /* Added for particle positioning */
+    overflow: hidden; /* Hide particles outside header bounds */
+}
+.royal-header h1 {
+    font-size: 3.5rem;
+    color: var(--royal-accent); /* Ensure text is visible */
+    text-shadow: 0 0 5px rgba(255, 215, 0, 0.5), 0 0 10px rgba(255, 215, 0, 0.3); /* Subtle golden glow */
+}
+.royal-header h2 {
+    font-size: 2rem;
+    color: var(--royal-accent); /* Ensure text is visible */
+    text-shadow: 0 0 5px rgba(255, 215, 0, 0.5), 0 0 10px rgba(255, 215, 0, 0.3); /* Subtle golden glow */
+    margin-top: 0.5rem;
+}
+
+/* Profile Picture */
+.profile-pic-container {
+    display: flex;
+    justify-content: center;
+    margin-bottom: 2rem;
+}
+.profile-pic {
+    width: 120px;
+    height: 120px; /* Further reduced height */
+    border-radius: 50%;
+    object-fit: cover;
+    border: 5px solid var(--royal-accent);
+    box-shadow: 0 0 20px var(--royal-accent), 0 0 40px rgba(0,0,0,0.5); /* Adjusted shadow for consistency */
+    transition: transform 0.3s ease-in-out;
+}
+.profile-pic:hover {
+    transform: scale(1.05);
+}
+
+/* Profile Description Styling */
+.profile-text-royal { 
+    font-size: 1.1rem; 
+    color: var(--royal-light-text); /* Changed to light text for better contrast */
+    line-height: 1.8; 
+    text-align: justify; /* Changed to justify for a more formal look */
+    max-width: 700px; /* Increased width for readability */
+    margin: 0 auto; 
+    padding: 0.5rem 1rem; /* Reduced vertical padding to minimum */
+    background: var(--royal-secondary-bg);
+    border-radius: 10px;
+    box-shadow: 0 5px 15px var(--royal-shadow);
+    border-left: 5px solid var(--royal-accent);
+    animation: slideInFromLeft 1s ease-out;
+}
+.profile-text-royal strong {
+    color: var(--royal-accent);
+}
+
+/* Image Gallery Styling */
+.image-card-royal {
+    text-align: center;
+    max-width: 350px;
+    background: var(--royal-secondary-bg);
+    border-radius: 10px;
+    overflow: hidden;
+    box-shadow: 0 5px 15px var(--royal-shadow);
+    transition: transform 0.3s ease-in-out, box-shadow 0.3s ease-in-out;
+    margin: 1rem auto; /* Center cards in columns */
+}
+.image-card-royal:hover {
+    transform: translateY(-10px);
+    box-shadow: 0 15px 25px var(--royal-accent); /* Consistent golden glow */
+}
+.image-card-royal img, .image-card-royal video {
+    width: 100%;
+    height: 280px; /* Slightly increased height */
+    object-fit: cover;
+    transition: transform 0.3s ease;
+}
+.image-card-royal img:hover {
+    transform: scale(1.02);
+}
+
+/* Gallery lightbox: the full-size image is display:none (and loading=lazy) until opened */
+.gallery-lightbox {
+    display: block;
+    min-height: 280px; /* Keeps the card's size while the thumbnail sits in the open overlay */
+}
+.gallery-lightbox summary {
+    list-style: none;
+    cursor: zoom-in;
+}
+.gallery-lightbox summary::-webkit-details-marker {
+    display: none;
+}
+.gallery-lightbox .gallery-full {
+    display: none;
+}
+/* A transformed or overflow:hidden card would trap the fixed overlay inside it */
+.image-card-royal:has(.gallery-lightbox[open]) {
+    transform: none;
+    overflow: visible;
+}
+.gallery-lightbox[open] summary {
+    position: fixed;
+    inset: 0;
+    z-index: 1000;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    background: rgba(0, 0, 0, 0.85);
+    cursor: zoom-out;
+}
+.gallery-lightbox[open] .gallery-thumb {
+    display: none;
+}
+.gallery-lightbox[open] .gallery-full {
+    display: block;
+    width: auto;
+    height: auto;
+    max-width: 90vw;
+    max-height: 90vh;
+    object-fit: contain;
+    border: 2px solid var(--royal-accent);
+}
+
+/* Animations */
+@keyframes slideInFromLeft {
+    from { opacity: 0; transform: translateX(-50px); }
+    to { opacity: 1; transform: translateX(0); }
+}
+@keyframes textGlow {
+    0% { text-shadow: 0 0 5px var(--royal-accent); }
+    100% { text-shadow: 0 0 20px var(--royal-accent), 0 0 30px var(--royal-accent); }
+}
+@keyframes pulse {
+    0% { transform: scale(1); }
+    50% { transform: scale(1.02); }
+    100% { transform: scale(1); }
+}
+@keyframes letterReveal {
+    0% { opacity: 0; transform: translateY(20px); }
+    100% { opacity: 1; transform: translateY(0); }
+}
+
+
+
+/* Social Icons */
+.social-icons {
+    text-align: center;
+    margin-top: 2rem;
+}
+.social-icons a {
+    color: var(--royal-light-text);
+    font-size: 2rem;
+    margin: 0 15px;
+    transition: color 0.3s ease, transform 0.3s ease;
+}
+.social-icons a:hover {
+    color: var(--royal-accent);
+    transform: translateY(-5px) scale(1.1);
+}
+
+/* Royal Name Bar */
+.royal-name-bar {
+    background-color: var(--royal-dark); /* Use the main navy blue */
+    padding: 1.5rem 1rem;
+    text-align: center;
+    border-radius: 10px;
+    margin-top: 2rem; /* Space from elements above */
+    box-shadow: 0 5px 15px var(--royal-shadow);
+    animation: fadeIn 1.5s ease-out;
+}
+.royal-name-bar h1 {
+    font-size: 2.5rem;
+    color: var(--royal-accent); /* Ensure text is visible */
+    margin-bottom: 0.5rem;
+    text-shadow: 0 0 10px var(--royal-accent), 0 0 20px rgba(255, 215, 0, 0.5); /* More pronounced golden glow */
+}
+.royal-name-bar h2 {
+    font-size: 1.5rem;
+    color: var(--royal-light-text);
+    margin-top: 0;
+}
+"""
+
+# Custom CSS for the skills section
+SKILLS_CSS = """
+/* Skill Card Styling */
+.skill-card {
+    background-color: var(--royal-secondary-bg);
+    border-radius: 10px;
+    padding: 1.5rem;
+    margin-bottom: 20px;
+    box-shadow: 0 4px 6px var(--royal-shadow);
+    display: flex;
+    align-items: flex-start;
+}
+
+.skill-logo-container {
+    flex-shrink: 0;
+    margin-right: 20px;
+}
+
+/* Skill Title */
+.skill-title {
+    font-size: 20px;
+    color: var(--royal-accent);
+    margin-bottom: 5px;
+}
+
+/* Skill Version */
+.skill-version {
+    font-size: 14px;
+    color: var(--royal-light-text);
+    margin-bottom: 10px;
+}
+
+/* Skill Description */
+.skill-description {
+    font-size: 16px;
+    color: var(--royal-light-text);
+    line-height: 1.6;
+}
+
+/* Filter Buttons */
+.filter-buttons {
+    display: flex;
+    gap: 10px;
+    justify-content: center;
+    margin-bottom: 2rem;
+}
+.filter-button {
+    padding: 10px 15px;
+    background-color: var(--royal-accent);
+    color: var(--royal-dark);
+    border: none;
+    border-radius: 5px;
+    cursor: pointer;
+    transition: background-color 0.3s ease;
+}
+.filter-button:hover {
+    background-color: #DAA520;
+}
+
+.work-sample-card {
+    background-color: var(--royal-dark);
+    border-radius: 10px;
+    padding: 1.5rem;
+    margin-bottom: 20px;
+    box-shadow: 0 4px 6px var(--royal-shadow);
+}
+"""
+
+# Custom CSS for the projects section
+PROJECTS_CSS = """
+/* Project Card Styling */
+.project-card {
+    background-color: var(--royal-secondary-bg); /* Use royal secondary background */
+    border-radius: 10px;
+    padding: 1.5rem;
+    margin-bottom: 20px;
+    box-shadow: 0 4px 6px var(--royal-shadow); /* Use royal shadow */
+    color: var(--royal-light-text); /* Default text color for card content */
+}
+.project-card h3 {
+    color: var(--royal-accent); /* Headings in gold */
+}
+.project-card p b {
+    color: var(--royal-accent); /* Bold text in gold */
+}
+
+/* Project Resources Section */
+.project-resources {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 10px;
+    margin-top: 1rem;
+}
+
+/* File Download Button Styling (using global .btn) */
+
+/* Search and Filter Controls (only the projects page's, not the global search box) */
+:root:has(#projects) :is(.stTextInput > div > div > input, .stMultiSelect > div > div) {
+    background-color: var(--royal-dark) !important;
+    color: var(--royal-light-text) !important;
+    border: 1px solid var(--royal-accent) !important;
+    border-radius: 5px !important;
+    box-shadow: inset 0 0 5px rgba(255, 215, 0, 0.2) !important;
+}
+:root:has(#projects) :is(.stTextInput > div > div > input:focus, .stMultiSelect > div > div:focus-within) {
+    border-color: var(--royal-accent) !important;
+    box-shadow: 0 0 10px var(--royal-accent), inset 0 0 8px rgba(255, 215, 0, 0.5) !important;
+}
+"""
+
+# Custom CSS for the certifications section
+CERTIFICATIONS_CSS = """
+/* Certification Card Styling */
+.cert-card {
+    background-color: var(--royal-secondary-bg); /* Use royal secondary background */
+    border-radius: 10px;
+    padding: 1.5rem;
+    box-shadow: 0 4px 6px var(--royal-shadow); /* Use royal shadow */
+    text-align: center;
+    height: 100%;
+    display: flex;
+    flex-direction: column;
+}
+.cert-icon {
+    font-size: 1.8rem;
+    margin-bottom: 0.5rem;
+    color: var(--royal-accent); /* Use royal accent color */
+}
+.cert-title {
+    font-weight: bold;
+    margin-bottom: 0.5rem;
+    color: var(--royal-accent); /* Use royal accent color */
+    font-size: 1.1rem;
+}
+.cert-org {
+    font-size: 0.9rem;
+    color: var(--royal-light-text); /* Use royal light text color */
+    margin-bottom: 0.5rem;
+    font-style: italic;
+}
+.cert-date {
+    font-size: 0.8rem;
+    color: var(--royal-light-text); /* Use royal light text color */
+    margin-bottom: 0.5rem;
+}
+.cert-details {
+    font-size: 0.9rem;
+    color: var(--royal-light-text); /* Use royal light text color */
+    margin-bottom: 1rem;
+    flex-grow: 1;
+}
+.cert-logo {
+    max-width: 80px;
+    max-height: 40px;
+    margin: 0 auto 0.5rem auto;
+    object-fit: contain;
+}
+.expiring-soon {
+    color: #ff4500; /* Keep original color for warning */
+    font-weight: bold;
+    animation: certPulse 2s infinite;
+}
+@keyframes certPulse {
+    0% { opacity: 1; }
+    50% { opacity: 0.6; }
+    100% { opacity: 1; }
+}
+.category-badge {
+    display: inline-block;
+    background-color: var(--royal-accent); /* Use royal accent color */
+    color: var(--royal-dark); /* Use royal dark color for text */
+    padding: 3px 8px;
+    border-radius: 10px;
+    font-size: 0.7rem;
+    margin-right: 4px;
+    margin-bottom: 8px;
+}
+"""
+
+# Custom CSS for the education section
+EDUCATION_CSS = """
+/* General Styling */
+:root:has(#education) hr {
+    border: none;
+    border-top: 2px solid var(--royal-accent); /* Use royal accent color */
+    margin: 20px 0;
+}
+.header-description {
+    text-align: center;
+    font-size: 18px;
+    margin-bottom: 20px;
+    color: var(--royal-light-text); /* Use royal light text color */
+}
+/* Education Card Styling */
+.education-card {
+    background-color: var(--royal-secondary-bg); /* Use royal secondary background */
+    border-radius: 10px;
+    padding: 1.5rem;
+    margin-bottom: 20px; /* Space between cards */
+    box-shadow: 0 4px 6px var(--royal-shadow); /* Use royal shadow */
+    display: flex; /* To align logo and text */
+    align-items: flex-start; /* Align items to the top */
+    color: var(--royal-light-text); /* Default text color for card content */
+}
+.education-card h3 {
+    color: var(--royal-accent); /* Headings in gold */
+}
+.education-card p b {
+    color: var(--royal-accent); /* Bold text in gold */
+}
+.education-logo-container {
+    flex-shrink: 0; /* Prevent logo from shrinking */
+    margin-right: 20px; /* Space between logo and text */
+}
+.education-details-content {
+    flex-grow: 1; /* Allow content to take available space */
+}
+"""
+
+# Custom CSS for the experience section
+EXPERIENCE_CSS = """
+:root:has(#experience) hr {
+    border: none;
+    border-top: 2px solid var(--royal-accent); /* Use royal accent color */
+    margin: 20px 0;
+}
+.experience-card {
+    background-color: var(--royal-secondary-bg); /* Use royal secondary background */
+    border-radius: 10px;
+    padding: 1.5rem;
+    margin-bottom: 20px;
+    box-shadow: 0 4px 6px var(--royal-shadow); /* Use royal shadow */
+    display: flex;
+    align-items: flex-start;
+    color: var(--royal-light-text); /* Default text color for card content */
+}
+.experience-card h3 {
+    color: var(--royal-accent); /* Headings in gold */
+}
+.experience-card p,
+.experience-card li,
+.experience-card div {
+    color: var(--royal-light-text); /* Ensure all text within card is light */
+}
+.experience-card h4 {
+    color: var(--royal-accent); /* Subheadings in gold */
+}
+.experience-card li {
+    color: var(--royal-light-text); /* List items in light text */
+}
+.experience-logo-container {
+    flex-shrink: 0;
+    margin-right: 20px;
+}
+.experience-details-content {
+    flex-grow: 1;
+}
+.experience-company-info {
+    font-size: 1.05rem;
+    color: var(--royal-light-text);
+    margin-bottom: 0.3rem;
+}
+.experience-company-info b {
+    color: var(--royal-accent);
+}
+.experience-duration {
+    font-size: 0.9rem;
+    color: var(--royal-light-text);
+    margin-bottom: 0.8rem;
+}
+"""
+
+# Custom CSS for the contact section
+CONTACT_CSS = """
+/* Resume Card Styling */
+.resume-card {
+    background-color: var(--royal-secondary-bg);
+    border-radius: 10px;
+    padding: 1.5rem;
+    margin-bottom: 20px;
+    box-shadow: 0 4px 6px var(--royal-shadow);
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+    text-align: center;
+    color: var(--royal-light-text); /* Ensure text color is light */
+}
+.resume-card h3 {
+    color: var(--royal-accent); /* Resume titles in gold */
+}
+.resume-card p {
+    color: var(--royal-light-text); /* Resume descriptions in light text */
+}
+.resume-card .stDownloadButton button {
+    background-color: var(--royal-accent);
+    color: var(--royal-dark);
+    font-weight: bold;
+}
+.resume-card .stDownloadButton button:hover {
+    background-color: #DAA520; /* Darker gold on hover */
+}
+.resume-card .stDownloadButton {
+    width: 100%;
+}
+"""
+
+# Fragment name -> CSS, registered by style_registry after styles.css
+APP_STYLES = {
+    "app": APP_CSS,
+    "letter_reveal": LETTER_REVEAL_CSS,
+}
+
+# Section name -> CSS, registered by style_registry after the app styles
+SECTION_STYLES = {
+    "profiles": PROFILE_CSS,
+    "skills": SKILLS_CSS,
+    "projects": PROJECTS_CSS,
+    "certifications": CERTIFICATIONS_CSS,
+    "education": EDUCATION_CSS,
+    "experience": EXPERIENCE_CSS,
+    "contacts": CONTACT_CSS,
+}
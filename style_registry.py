@@ -0,0 +1,315 @@
+# style_registry.py
+"""
+Collects the CSS of the app and its sections into one stylesheet.
+
+``styles.css`` and the CSS of the app and of every section live in
+``section_styles`` and are registered when this module is imported, without
+importing the sections themselves. More CSS can be added with
+``register_styles`` (or ``register_stylesheet`` for a file).
+``inject_styles`` compiles everything registered:
+
+    - ``@import`` rules are hoisted to the top and de-duplicated
+    - ``:root`` variables are merged into a single rule
+    - ``@keyframes`` and identical rules are kept once
+    - comments and whitespace are stripped
+
+The result is named after its content hash, so a deploy has one bundle. It is
+added to the page once per browser session, as a ``<link>`` to
+``app/static/assets/css/<hash>.css`` when static serving is on, or as an inline
+``<style>`` otherwise. Reruns send nothing. The stylesheet is sent again only
+when its CSS changes (e.g. ``styles.css`` is edited). ``build_assets --prune``
+removes bundles that are no longer current.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from assets import ASSET_DIR, HASH_LENGTH, STATIC_URL_PREFIX, static_serving_enabled
+from section_styles import APP_STYLES, BASE_STYLESHEET, SECTION_STYLES
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STYLE_DIR = os.path.join(ASSET_DIR, "css")
+SESSION_KEY = "_style_bundle_hash"
+ELEMENT_ID = "portfolio-styles"
+
+# Fragments are compiled in (order, name) order so the result does not depend on import order
+ORDER_BASE = 0
+ORDER_APP = 10
+ORDER_SECTION = 50
+
+# Quoted strings are matched first so that they are left untouched
+_STRING_PATTERN = r""""(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'"""
+_STRING_RE = re.compile(f"({_STRING_PATTERN})", re.S)
+_COMMENT_RE = re.compile(f"({_STRING_PATTERN})|/\\*.*?\\*/", re.S)
+_STYLE_TAG_RE = re.compile(r"</?style[^>]*>", re.I)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_lock = threading.Lock()
+_fragments: Dict[str, Tuple[int, str]] = {}
+_stylesheets: Dict[str, Tuple[int, str]] = {}
+_file_cache: Dict[Tuple[str, float], str] = {}
+_bundle_cache: Dict[tuple, Tuple[str, str]] = {}
+
+
+def register_styles(name: str, css: str, order: int = ORDER_SECTION) -> None:
+    """Register (or replace) the CSS fragment ``name``. ``<style>`` tags are ignored."""
+    with _lock:
+        _fragments[name] = (order, _STYLE_TAG_RE.sub("", css))
+
+
+def register_stylesheet(name: str, path: str, order: int = ORDER_BASE) -> None:
+    """Register a CSS file; it is re-read only when its mtime changes."""
+    with _lock:
+        _stylesheets[name] = (order, path)
+
+
+# Everything is registered up front, so the bundle does not change as sections are imported
+register_stylesheet("base", BASE_STYLESHEET, order=ORDER_BASE)
+for _name, _css in APP_STYLES.items():
+    register_styles(_name, _css, order=ORDER_APP)
+for _name, _css in SECTION_STYLES.items():
+    register_styles(_name, _css)
+
+
+def _read_stylesheet(path: str) -> str:
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        logger.error(f"Stylesheet not found: {path}")
+        return ""
+    css = _file_cache.get((path, mtime))
+    if css is None:
+        with open(path, encoding="utf-8") as f:
+            css = f.read()
+        _file_cache[(path, mtime)] = css
+    return css
+
+
+# === Parsing and minifying ===
+
+def _split_top_level(css: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    Split CSS into top-level ``(prelude, body)`` pairs. Statements such as
+    ``@import`` have a body of None.
+    """
+    items, depth, quote, start, body_start = [], 0, None, 0, 0
+    prelude = ""
+    for i, char in enumerate(css):
+        if quote:
+            if char == quote and css[i - 1] != "\\":
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            if depth == 0:
+                prelude, body_start = css[start:i], i + 1
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                items.append((prelude.strip(), css[body_start:i]))
+                start = i + 1
+        elif char == ";" and depth == 0:
+            if css[start:i].strip():
+                items.append((css[start:i].strip(), None))
+            start = i + 1
+    return items
+
+
+def _split_declarations(body: str) -> List[str]:
+    """Split a declaration block on ``;`` outside of quotes and parentheses."""
+    parts, depth, quote, start = [], 0, None, 0
+    for i, char in enumerate(body):
+        if quote:
+            if char == quote and body[i - 1] != "\\":
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == ";" and depth == 0:
+            parts.append(body[start:i])
+            start = i + 1
+    parts.append(body[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _strip_comments(css: str) -> str:
+    return _COMMENT_RE.sub(lambda match: match.group(1) or "", css)
+
+
+def _outside_strings(text: str, minify) -> str:
+    """Apply ``minify`` to the parts of ``text`` that are not quoted strings."""
+    parts = _STRING_RE.split(text)
+    return "".join(part if i % 2 else minify(part) for i, part in enumerate(parts)).strip()
+
+
+def _minify_prelude(prelude: str) -> str:
+    return _outside_strings(prelude, lambda part: re.sub(r"\s*([,>])\s*", r"\1", _WHITESPACE_RE.sub(" ", part)))
+
+
+def _minify_value(part: str) -> str:
+    part = re.sub(r"\s*,\s*", ",", _WHITESPACE_RE.sub(" ", part))
+    return part.replace(" !important", "!important")
+
+
+def _minify_declarations(body: str) -> List[Tuple[str, str]]:
+    declarations = []
+    for declaration in _split_declarations(body):
+        prop, _, value = declaration.partition(":")
+        declarations.append((prop.strip(), _outside_strings(value, _minify_value)))
+    return declarations
+
+
+def _format_declarations(declarations) -> str:
+    return ";".join(f"{prop}:{value}" for prop, value in declarations)
+
+
+def _minify_block(prelude: str, body: str) -> str:
+    """
+    Minify one rule or at-rule. At-rules that hold rules (``@media``,
+    ``@keyframes``...) are minified block by block; those that hold
+    declarations (``@font-face``, ``@page``...) like a plain rule.
+    """
+    if prelude.startswith("@"):
+        blocks = [(p, b) for p, b in _split_top_level(body) if b is not None]
+        if blocks:
+            inner = "".join(_minify_block(_minify_prelude(p), b) for p, b in blocks)
+            return f"{prelude}{{{inner}}}"
+    return f"{prelude}{{{_format_declarations(_minify_declarations(body))}}}"
+
+
+def compile_css(fragments: List[Tuple[str, str]]) -> str:
+    """
+    Merge ``[(name, css)]`` into one minified stylesheet.
+
+    A ``:root`` variable defined again with a different value takes the later
+    value, as it would in the browser, and a warning is logged. The first
+    ``@keyframes`` of a name wins; conflicting redefinitions are logged and dropped.
+    """
+    imports: List[str] = []
+    root_vars: Dict[str, Tuple[str, str]] = {}
+    keyframes: Dict[str, Tuple[str, str]] = {}
+    rules: List[str] = []
+    seen_rules = set()
+
+    for name, css in fragments:
+        for prelude, body in _split_top_level(_strip_comments(css)):
+            prelude = _minify_prelude(prelude)
+            if body is None:
+                if prelude.startswith("@import") and prelude not in imports:
+                    imports.append(prelude)
+                continue
+            if prelude == ":root":
+                for prop, value in _minify_declarations(body):
+                    if prop in root_vars and root_vars[prop][0] != value:
+                        logger.warning(f"{name}: {prop}: {value} overrides {root_vars[prop][0]} "
+                                       f"(set by {root_vars[prop][1]}); scope it to a selector if only one page needs it")
+                    root_vars[prop] = (value, name)
+                continue
+            block = _minify_block(prelude, body)
+            if prelude.startswith("@keyframes"):
+                if prelude in keyframes:
+                    if keyframes[prelude][0] != block:
+                        logger.warning(f"{name}: ignoring conflicting {prelude} (already defined by {keyframes[prelude][1]})")
+                    continue
+                keyframes[prelude] = (block, name)
+            elif block in seen_rules:
+                continue
+            seen_rules.add(block)
+            rules.append(block)
+
+    parts = [f"{statement};" for statement in imports]
+    if root_vars:
+        parts.append(f":root{{{_format_declarations((prop, value) for prop, (value, _) in root_vars.items())}}}")
+    parts.extend(rules)
+    return "".join(parts)
+
+
+# === Bundling and injection ===
+
+def get_bundle() -> Tuple[str, str]:
+    """Return ``(content_hash, css)`` for everything registered so far."""
+    with _lock:
+        sources = [(order, name, css) for name, (order, css) in _fragments.items()]
+        sources += [(order, name, _read_stylesheet(path)) for name, (order, path) in _stylesheets.items()]
+        sources.sort(key=lambda source: (source[0], source[1]))
+        key = tuple((name, hashlib.sha256(css.encode()).hexdigest()) for _, name, css in sources)
+        bundle = _bundle_cache.get(key)
+        if bundle is None:
+            css = compile_css([(name, css) for _, name, css in sources])
+            bundle = (hashlib.sha256(css.encode()).hexdigest()[:HASH_LENGTH], css)
+            _bundle_cache.clear()
+            _bundle_cache[key] = bundle
+            logger.info(f"Compiled stylesheet {bundle[0]} ({len(css):,} bytes from {len(sources)} fragment(s))")
+        return bundle
+
+
+def publish_bundle(bundle_hash: str, css: str) -> str:
+    """Write the bundle under ``static/assets/css/`` (once) and return its URL."""
+    path = os.path.join(STYLE_DIR, f"{bundle_hash}.css")
+    if not os.path.exists(path):
+        os.makedirs(STYLE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(css)
+        os.replace(tmp_path, path)
+    return f"{STATIC_URL_PREFIX}assets/css/{bundle_hash}.css"
+
+
+def _injector_html(bundle_hash: str, css: str, href: Optional[str]) -> str:
+    """Script that adds (or swaps) the stylesheet in the parent page's ``<head>``."""
+    payload = json.dumps({"id": ELEMENT_ID, "hash": bundle_hash, "href": href, "css": None if href else css})
+    payload = payload.replace("</", "<\\/")
+    return f"""<script>
+    (function () {{
+        const cfg = {payload};
+        const doc = window.parent.document;
+        const old = doc.getElementById(cfg.id);
+        if (old && old.dataset.hash === cfg.hash) return;
+        let el;
+        if (cfg.href) {{
+            el = doc.createElement("link");
+            el.rel = "stylesheet";
+            el.href = new URL(cfg.href, window.parent.location.href).href;
+            // Keep the old sheet until the new one has loaded to avoid a flash of unstyled content
+            el.onload = function () {{ if (old) old.remove(); }};
+        }} else {{
+            el = doc.createElement("style");
+            el.textContent = cfg.css;
+            if (old) old.remove();
+        }}
+        el.dataset.hash = cfg.hash;
+        if (old) old.id = "";
+        el.id = cfg.id;
+        doc.head.appendChild(el);
+    }})();
+    </script>"""
+
+
+def inject_styles() -> None:
+    """Add the compiled stylesheet to the page unless this session already has it."""
+    bundle_hash, css = get_bundle()
+    if st.session_state.get(SESSION_KEY) == bundle_hash:
+        return
+
+    href = None
+    if static_serving_enabled():
+        try:
+            href = publish_bundle(bundle_hash, css)
+        except OSError as e:
+            logger.error(f"Error writing stylesheet {bundle_hash}: {e}")
+    components.html(_injector_html(bundle_hash, css, href), height=0)
+    st.session_state[SESSION_KEY] = bundle_hash
@@ -1,38 +1,64 @@
 # utils.py
 import streamlit as st
-import base64
 import os
+from functools import lru_cache
+from html import escape
+from assets import file_href, get_pdf_thumbnail_path, image_src, static_serving_enabled
+from downloads import download_link_html
+from section_styles import LETTER_REVEAL_MAX_STAGGER
 
-def get_pdf_display_link(pdf_path: str) -> str:
-    """Create a base64 encoded link to preview a PDF file."""
-    try:
-        with open(pdf_path, "rb") as f:
-            base64_pdf = base64.b64encode(f.read()).decode('utf-8')
+def pdf_preview_html(pdf_path: str, width: str = "400") -> str:
+    """Build the first-page thumbnail preview of a PDF file.
 
-        # Create a data URL for the PDF
-        pdf_display = f'<embed src="data:application/pdf;base64,{base64_pdf}" width="400" height="300" type="application/pdf">'
-        return pdf_display
-    except Exception as e:
-        st.error(f"Error generating PDF preview: {e}")
-        return ""
+    The full document is only fetched when the visitor clicks the thumbnail.
+
+    Raises:
+        ValueError: If the first page could not be rendered
+        OSError: If the PDF cannot be read or published
+    """
+    thumb_path = get_pdf_thumbnail_path(pdf_path)
+    if thumb_path is None:
+        raise ValueError(f"could not render the first page of {os.path.basename(pdf_path)}")
+
+    thumb_html = f'<img src="{image_src(thumb_path)}" class="pdf-thumbnail" width="{width}" loading="lazy" alt="Preview of {os.path.basename(pdf_path)}">'
+    if not static_serving_enabled():
+        # Without a URL to link to, the full PDF is available from the download link only
+        return thumb_html
+    return f'<a href="{file_href(pdf_path)}" target="_blank" rel="noopener" title="Open full PDF">{thumb_html}</a>'
 
 def get_binary_file_downloader_html(file_path: str, file_label: str = "File") -> str:
-    """Generate a download link for a binary file."""
+    """Generate a download link for a binary file.
+
+    Returns "" when static serving is off; callers then fall back to
+    ``downloads.render_download_button`` so the file is still read lazily.
+    """
     try:
-        with open(file_path, "rb") as f:
-            file_data = f.read()
-        b64 = base64.b64encode(file_data).decode()
-        href = f'<a href="data:application/octet-stream;base64,{b64}" download="{os.path.basename(file_path)}" class="btn">{file_label}</a>'
-        return href
+        return download_link_html(file_path, file_label) or ""
     except Exception as e:
         st.error(f"Error generating download link: {e}")
         return ""
 
-def animate_text_letter_by_letter(text, tag='span', delay_per_letter=0.05, animation_duration=0.5):
-    html_content = ""
-    for i, char in enumerate(text):
+
+@lru_cache(maxsize=256)
+def animate_text_letter_by_letter(text, tag='span', delay_per_letter=0.05, animation_duration=0.5, infinite=True):
+    """
+    Wrap each letter of ``text`` in ``tag`` so it is revealed one after another.
+
+    Timing is passed once, as CSS custom properties on a wrapper element. With
+    ``infinite=False`` the reveal plays once and the letters stay visible, so
+    the browser stops animating them.
+    """
+    style = f"--letter-delay: {delay_per_letter}s; --letter-duration: {animation_duration}s;"
+    if not infinite:
+        style += " --letter-iterations: 1; --letter-fill: both;"
+
+    parts = []
+    index = 0
+    for char in text:
         if char == " ": # Handle spaces
-            html_content += " "
-        else:
-            html_content += f'<{tag} style="display: inline-block; animation: letterReveal {animation_duration}s ease-out {i * delay_per_letter}s infinite;">{char}</{tag}>'
-    return html_content
\ No newline at end of file
+            parts.append(" ")
+            continue
+        extra = f' style="--i: {index};"' if index >= LETTER_REVEAL_MAX_STAGGER else ""
+        parts.append(f"<{tag}{extra}>{escape(char)}</{tag}>")
+        index += 1
+    return f'<{tag} class="letter-reveal" style="{style}">{"".join(parts)}</{tag}>'